@@ -20,4 +20,9 @@ USER_AGENT = "JobPulse/1.0"
 
 # Connection Pool Settings
 MAX_CONNECTIONS = 10
-MAX_KEEPALIVE_CONNECTIONS = 5
+MAX_KEEPALIVE_CONNECTIONS = 10  # enough idle connections to keep for search_jobs_paged's workers
+KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection is kept open for reuse
+
+# HTTP Response Cache (opt-in; also needs the optional `hishel>=1.0` package)
+HTTP_CACHE_ENABLED = False
+HTTP_CACHE_DIR = ".http_cache"
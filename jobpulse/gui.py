@@ -5,14 +5,19 @@ Provides a clean, theme-switchable interface for job searching and management.
 
 import logging
 import threading
+import tkinter
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 from dateutil import parser as date_parser
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
-from jobpulse import locations, orm, scraper
+from jobpulse import http_client, locations, orm, scraper
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,81 @@ THEMES = {
 
 DEFAULT_THEME = "Dark Blue"
 
+# Location dropdown entries, built once from the static city list. Every location
+# menu is handed this same list; CTkOptionMenu only reads it (cget returns a copy).
+LOCATION_OPTIONS: List[str] = ["Any Location", *locations.CITY_NAMES]
+
+# "Posted Within" and "Work Arrangement" display text mapped to API values
+_POSTED_MAP = {
+    "": "",
+    "Today": "1",
+    "Last 2 days": "2",
+    "Last 3 days": "3",
+    "Last 4 days": "4",
+    "Last 5 days": "5",
+}
+_WORKPLACE_MAP = {"Work from Home": "1"}
+
+# Fallbacks for search filters passed as None, and the filters sent to the API as integers
+_SEARCH_DEFAULTS = {
+    "location": "",
+    "job_type": "",
+    "job_level": "",
+    "posted_within": "",
+    "exp_start": "0",
+    "exp_end": "0",
+    "salary_start": "0",
+    "salary_end": "0",
+    "workplace": "",
+}
+_INT_FIELDS = ("exp_start", "exp_end", "salary_start", "salary_end")
+
+# Job cards are built lazily as the list scrolls, in small batches of at most one per frame
+RESULTS_FIRST_BATCH = 6  # roughly one screenful
+RESULTS_BATCH_SIZE = 5
+RESULTS_BATCH_DELAY_MS = 16  # one frame at 60 FPS
+RESULTS_PREFETCH_THRESHOLD = 0.85  # build more once the view reaches this fraction of the list
+
+# Saved jobs and applications are fetched and drawn this many at a time ("Load more" gets the next lot)
+LIST_PAGE_SIZE = 20
+
+# Label colour for each application status
+STATUS_COLORS = {
+    "interested": "orange",
+    "applied": "blue",
+    "interview": "purple",
+    "rejected": "red",
+    "accepted": "green",
+}
+
+# Shared styling for the sidebar navigation buttons
+NAV_BUTTON_STYLE = {
+    "height": 40,
+    "fg_color": "transparent",
+    "hover_color": ("gray70", "gray30"),
+    "text_color": ("gray10", "gray90"),  # Dark text for light mode, light text for dark mode
+}
+
+# Database writes from button handlers run here, one at a time and in click order
+_db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobpulse-db")
+
+# Shared fonts, created on first use (a Tk root must exist before any CTkFont)
+_fonts: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Get a shared CTkFont for the given size and weight.
+
+    Widgets with identical fonts reuse one Tk font object instead of each
+    registering their own.
+    """
+    font = _fonts.get((size, weight))
+    if font is None:
+        font = ctk.CTkFont(size=size, weight=weight)
+        _fonts[(size, weight)] = font
+    return font
+
 
 # ============================================================================
 # Main Application Window
@@ -66,6 +146,18 @@ def create_main_window() -> ctk.CTk:
         "current_page": 1,
         "results_per_page": 10,
         "search_params": {},
+        "theme": saved_theme,
+        "profiles": None,
+        "profile_label": None,
+        "stats_labels": {},
+        "search_generation": 0,
+        "pagination_buttons": [],
+        "page_var": None,
+        "per_page_var": None,
+        "results_widgets": None,
+        "loading_overlay": None,
+        # One pooled keep-alive client for every search in this session
+        "http_client": http_client.get_http_client(),
     }
 
     # Create menu bar
@@ -74,9 +166,35 @@ def create_main_window() -> ctk.CTk:
     # Create main content area
     create_main_content(window)
 
+    # Profile and statistics are filled in once loaded, so the window can paint first
+    preload_startup_data(window)
+
     return window
 
 
+def preload_startup_data(window: ctk.CTk) -> None:
+    """Load profiles and statistics in the background and fill in the placeholder widgets."""
+
+    def preload_thread():
+        try:
+            profiles = orm.get_all_profiles()
+            stats_data = orm.get_user_statistics()
+        except Exception as e:
+            logger.error(f"Failed to load startup data: {e}", exc_info=True)
+            return
+
+        # Schedule GUI updates on main thread
+        def update_ui():
+            window.app_state["profiles"] = profiles
+            update_profile_display(window)
+            update_stats_display(window, stats_data)
+
+        window.after(0, update_ui)
+
+    thread = threading.Thread(target=preload_thread, daemon=True)
+    thread.start()
+
+
 def apply_theme(theme_name: str) -> None:
     """Save the selected theme (requires app restart to take effect)."""
     # Save theme preference to database
@@ -92,10 +210,10 @@ def create_menu_bar(window: ctk.CTk) -> None:
     menu_frame.pack_propagate(False)
 
     # App title
-    title_label = ctk.CTkLabel(menu_frame, text="JobPulse", font=ctk.CTkFont(size=14, weight="bold"))
+    title_label = ctk.CTkLabel(menu_frame, text="JobPulse", font=get_font(14, "bold"))
     title_label.pack(side="left", padx=16)
 
-    current_theme = orm.get_config("theme", DEFAULT_THEME)
+    current_theme = window.app_state["theme"]
 
     theme_menu = ctk.CTkOptionMenu(
         menu_frame,
@@ -116,7 +234,8 @@ def restart_application(window: ctk.CTk) -> None:
     # Close current window
     window.destroy()
 
-    # Close resources
+    # Close resources, letting queued writes finish before the database is closed
+    _db_executor.shutdown(wait=True)
     scraper.close_http_client()
     orm.close_database()
 
@@ -132,20 +251,16 @@ def on_theme_change(theme_name: str, window: ctk.CTk) -> None:
     # Show restart notification
     notification = ctk.CTkToplevel(window)
     notification.title("Theme Changed")
-    notification.geometry("450x200")
     notification.transient(window)
     notification.grab_set()
 
     # Center the notification
-    notification.update_idletasks()
-    x = window.winfo_x() + (window.winfo_width() - notification.winfo_width()) // 2
-    y = window.winfo_y() + (window.winfo_height() - notification.winfo_height()) // 2
-    notification.geometry(f"+{x}+{y}")
+    center_on_window(notification, window, 450, 200)
 
     msg_label = ctk.CTkLabel(
         notification,
         text=f"Theme '{theme_name}' saved!\n\nPlease restart the application\nfor the theme to take effect.",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         justify="center",
     )
     msg_label.pack(pady=(30, 20))
@@ -190,18 +305,21 @@ def create_sidebar(parent: ctk.CTkFrame) -> None:
     sidebar.pack(side="left", fill="y", padx=0, pady=0)
     sidebar.pack_propagate(False)
 
+    # Get root window reference
+    root_window = parent.winfo_toplevel()
+
     # Profile section header
     profile_header = ctk.CTkLabel(
         sidebar,
         text="User Profile",
-        font=ctk.CTkFont(size=14, weight="bold"),
+        font=get_font(14, "bold"),
         text_color=("gray10", "gray90"),  # Dark text for light mode, light text for dark mode
     )
     profile_header.pack(pady=(12, 10), padx=16)
 
     # Profile configure button
     profile_button = ctk.CTkButton(
-        sidebar, text="⚙ Configure Profile", command=open_profile_config, height=40, font=ctk.CTkFont(size=14)
+        sidebar, text="⚙ Configure Profile", command=open_profile_config, height=40, font=get_font(14)
     )
     profile_button.pack(pady=12, padx=16, fill="x")
 
@@ -209,24 +327,15 @@ def create_sidebar(parent: ctk.CTkFrame) -> None:
     active_profile_frame = ctk.CTkFrame(sidebar)
     active_profile_frame.pack(pady=12, padx=16, fill="x")
 
-    profiles = orm.get_all_profiles()
-    if profiles:
-        profile = profiles[0]
-        profile_info = ctk.CTkLabel(
-            active_profile_frame,
-            text=f"Active: {profile['name']}\n{profile.get('email', 'No email')}",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray20", "gray80"),  # Adaptive color for both themes
-        )
-        profile_info.pack(pady=12)
-    else:
-        no_profile = ctk.CTkLabel(
-            active_profile_frame,
-            text="No profile configured",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray40", "gray60"),  # Adaptive gray
-        )
-        no_profile.pack(pady=12)
+    profile_info = ctk.CTkLabel(
+        active_profile_frame,
+        text="Loading profile...",
+        font=get_font(14),
+        text_color=("gray40", "gray60"),  # Adaptive gray
+    )
+    profile_info.pack(pady=12)
+    root_window.app_state["profile_label"] = profile_info
+    update_profile_display(root_window)
 
     # Divider
     divider = ctk.CTkFrame(sidebar, height=1, fg_color=("gray70", "gray30"))
@@ -236,33 +345,22 @@ def create_sidebar(parent: ctk.CTkFrame) -> None:
     nav_header = ctk.CTkLabel(
         sidebar,
         text="Navigation",
-        font=ctk.CTkFont(size=14, weight="bold"),
+        font=get_font(14, "bold"),
         text_color=("gray10", "gray90"),  # Dark text for light mode, light text for dark mode
     )
     nav_header.pack(pady=(12, 10), padx=16)
 
-    # Get root window reference
-    root_window = parent.winfo_toplevel()
-
     nav_buttons = [
-        ("🏠 Home", lambda: show_home_view(root_window)),
-        ("🔍 Search Jobs", lambda: show_search_view(root_window)),
-        ("💼 My Applications", lambda: show_applications_view(root_window)),
-        ("⭐ Saved Jobs", lambda: show_saved_jobs_view(root_window)),
-        ("📊 Dashboard", lambda: show_dashboard_view(root_window)),
+        ("🏠 Home", show_home_view),
+        ("🔍 Search Jobs", show_search_view),
+        ("💼 My Applications", show_applications_view),
+        ("⭐ Saved Jobs", show_saved_jobs_view),
+        ("📊 Dashboard", show_dashboard_view),
     ]
 
-    for text, command in nav_buttons:
+    for text, view in nav_buttons:
         btn = ctk.CTkButton(
-            sidebar,
-            text=text,
-            command=command,
-            height=40,
-            font=ctk.CTkFont(size=14),
-            fg_color="transparent",
-            hover_color=("gray70", "gray30"),
-            text_color=("gray10", "gray90"),  # Dark text for light mode, light text for dark mode
-            anchor="w",
+            sidebar, text=text, command=partial(view, root_window), font=get_font(14), anchor="w", **NAV_BUTTON_STYLE
         )
         btn.pack(pady=5, padx=16, fill="x")
 
@@ -270,16 +368,30 @@ def create_sidebar(parent: ctk.CTkFrame) -> None:
     settings_button = ctk.CTkButton(
         sidebar,
         text="⚙ Settings",
-        command=lambda: show_dashboard_view(root_window),
-        height=40,
-        font=ctk.CTkFont(size=14),
-        fg_color="transparent",
-        hover_color=("gray70", "gray30"),
-        text_color=("gray10", "gray90"),  # Dark text for light mode, light text for dark mode
+        command=partial(show_dashboard_view, root_window),
+        font=get_font(14),
+        **NAV_BUTTON_STYLE,
     )
     settings_button.pack(side="bottom", pady=12, padx=16, fill="x")
 
 
+def update_profile_display(window: ctk.CTk) -> None:
+    """Show the active profile in the sidebar once profiles have been loaded."""
+    profiles = window.app_state["profiles"]
+    profile_label = window.app_state["profile_label"]
+    if profiles is None or profile_label is None:
+        return
+
+    if profiles:
+        profile = profiles[0]
+        profile_label.configure(
+            text=f"Active: {profile['name']}\n{profile.get('email', 'No email')}",
+            text_color=("gray20", "gray80"),  # Adaptive color for both themes
+        )
+    else:
+        profile_label.configure(text="No profile configured", text_color=("gray40", "gray60"))
+
+
 def create_content_area(parent: ctk.CTkFrame) -> None:
     """Create the main content area."""
 
@@ -287,14 +399,14 @@ def create_content_area(parent: ctk.CTkFrame) -> None:
     content_frame.pack(side="right", fill="both", expand=True, padx=0, pady=0)
 
     # Welcome header
-    header = ctk.CTkLabel(content_frame, text="Welcome to JobPulse", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(content_frame, text="Welcome to JobPulse", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
     # Description
     description = ctk.CTkLabel(
         content_frame,
         text="Your intelligent job search companion\n\nGet started by configuring your profile and searching for jobs",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         justify="center",
     )
     description.pack(pady=12)
@@ -303,7 +415,7 @@ def create_content_area(parent: ctk.CTkFrame) -> None:
     search_frame = ctk.CTkFrame(content_frame, width=600)
     search_frame.pack(pady=20, padx=16)
 
-    search_label = ctk.CTkLabel(search_frame, text="Quick Search", font=ctk.CTkFont(size=14, weight="bold"))
+    search_label = ctk.CTkLabel(search_frame, text="Quick Search", font=get_font(14, "bold"))
     search_label.pack(pady=(12, 10))
 
     # Search inputs
@@ -311,14 +423,13 @@ def create_content_area(parent: ctk.CTkFrame) -> None:
     input_frame.pack(pady=12, padx=16)
 
     keyword_entry = ctk.CTkEntry(
-        input_frame, placeholder_text="Job title or keyword", width=300, height=40, font=ctk.CTkFont(size=14)
+        input_frame, placeholder_text="Job title or keyword", width=300, height=40, font=get_font(14)
     )
     keyword_entry.pack(pady=5)
 
     location_var = ctk.StringVar(value="Any Location")
-    location_options = ["Any Location"] + [city["name"] for city in locations.CITY_ID_MAP]
     location_menu = ctk.CTkOptionMenu(
-        input_frame, variable=location_var, values=location_options, width=300, height=40
+        input_frame, variable=location_var, values=LOCATION_OPTIONS, width=300, height=40
     )
     location_menu.pack(pady=5)
 
@@ -331,7 +442,7 @@ def create_content_area(parent: ctk.CTkFrame) -> None:
         command=lambda: perform_search(root_window, keyword_entry.get(), location_var.get()),
         width=300,
         height=40,
-        font=ctk.CTkFont(size=14, weight="bold"),
+        font=get_font(14, "bold"),
     )
     search_button.pack(pady=20)
 
@@ -342,28 +453,28 @@ def create_content_area(parent: ctk.CTkFrame) -> None:
     stats_frame = ctk.CTkFrame(content_frame)
     stats_frame.pack(pady=20, padx=16, fill="x")
 
-    stats_label = ctk.CTkLabel(stats_frame, text="Statistics", font=ctk.CTkFont(size=14, weight="bold"))
+    stats_label = ctk.CTkLabel(stats_frame, text="Statistics", font=get_font(14, "bold"))
     stats_label.pack(pady=(12, 10))
 
     stats_container = ctk.CTkFrame(stats_frame, fg_color="transparent")
     stats_container.pack(pady=12, padx=16)
 
-    # Get real stats
-    stats_data = get_user_statistics()
+    # Real stats are filled in by preload_startup_data
     stats = [
-        ("Jobs Saved", str(stats_data["saved_jobs"])),
-        ("Applications", str(stats_data["applications"])),
-        ("Interviews", str(stats_data["interviews"])),
+        ("Jobs Saved", "saved_jobs"),
+        ("Applications", "applications"),
+        ("Interviews", "interviews"),
     ]
 
-    for i, (label, value) in enumerate(stats):
+    for i, (label, key) in enumerate(stats):
         stat_box = ctk.CTkFrame(stats_container, width=150)
         stat_box.grid(row=0, column=i, padx=10, pady=12)
 
-        value_label = ctk.CTkLabel(stat_box, text=value, font=ctk.CTkFont(size=14, weight="bold"))
+        value_label = ctk.CTkLabel(stat_box, text="...", font=get_font(14, "bold"))
         value_label.pack(pady=(12, 5))
+        root_window.app_state["stats_labels"][key] = value_label
 
-        label_text = ctk.CTkLabel(stat_box, text=label, font=ctk.CTkFont(size=14), text_color=("gray30", "gray70"))
+        label_text = ctk.CTkLabel(stat_box, text=label, font=get_font(14), text_color=("gray30", "gray70"))
         label_text.pack(pady=(0, 15))
 
 
@@ -377,14 +488,14 @@ def open_profile_config() -> None:
     config_window.grab_set()
 
     # Header
-    header = ctk.CTkLabel(config_window, text="User Profile Configuration", font=ctk.CTkFont(size=14, weight="bold"))
+    header = ctk.CTkLabel(config_window, text="User Profile Configuration", font=get_font(14, "bold"))
     header.pack(pady=(12, 10))
 
     # Description
     desc = ctk.CTkLabel(
         config_window,
         text="Configure your profile details and job preferences",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         text_color=("gray30", "gray70"),
     )
     desc.pack(pady=(0, 20))
@@ -404,7 +515,7 @@ def open_profile_config() -> None:
         "• Skills and experience\n"
         "• Salary expectations\n"
         "• Location preferences",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         justify="left",
     )
     placeholder_label.pack(pady=12, padx=16)
@@ -437,53 +548,50 @@ def on_save_profile(window: ctk.CTkToplevel) -> None:
 
 
 def clear_content(window: ctk.CTk) -> ctk.CTkFrame:
-    """Clear the current content area and return a new frame."""
-    if window.app_state["content_frame"]:
-        old_frame = window.app_state["content_frame"]
-        # Clear the reference first to prevent access during destruction
-        window.app_state["content_frame"] = None
-        
-        # Process all pending events
-        window.update_idletasks()
-        window.update()
-        
-        # Destroy all children first to prevent widget update errors
-        try:
-            for child in old_frame.winfo_children():
-                try:
-                    child.destroy()
-                except:
-                    pass
-        except:
-            pass
-        
-        # Now destroy the frame itself
-        try:
-            old_frame.destroy()
-        except Exception as e:
-            logger.warning(f"Error destroying content frame: {e}")
+    """Clear the current content area and return the (now empty) content frame."""
+    content_frame = window.app_state["content_frame"]
+    if content_frame is None:
+        main_frame = window.app_state["main_frame"]
+        content_frame = ctk.CTkFrame(main_frame, corner_radius=0)
+        content_frame.pack(side="right", fill="both", expand=True, padx=0, pady=0)
+        window.app_state["content_frame"] = content_frame
+        return content_frame
+
+    # The content frame itself stays in place across views; only the previous view's widgets go.
+    # Hide them now and let Tk destroy them on the next idle pass, together with the first layout
+    # of the new view.
+    old_widgets = content_frame.winfo_children()
+    for widget in old_widgets:
+        widget.pack_forget()
+    window.after_idle(destroy_widgets, old_widgets)
 
-    main_frame = window.app_state["main_frame"]
-    content_frame = ctk.CTkFrame(main_frame, corner_radius=0)
-    content_frame.pack(side="right", fill="both", expand=True, padx=0, pady=0)
-    window.app_state["content_frame"] = content_frame
     return content_frame
 
 
+def destroy_widgets(widgets: List[Any]) -> None:
+    """Destroy the given widgets (and, transitively, their children)."""
+    for widget in widgets:
+        try:
+            widget.destroy()
+        except tkinter.TclError:
+            # Already torn down along with its toplevel
+            pass
+
+
 def show_home_view(window: ctk.CTk) -> None:
     """Display the home/welcome view."""
     content_frame = clear_content(window)
     window.app_state["current_view"] = "home"
 
     # Welcome header
-    header = ctk.CTkLabel(content_frame, text="Welcome to JobPulse", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(content_frame, text="Welcome to JobPulse", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
     # Description
     description = ctk.CTkLabel(
         content_frame,
         text="Your intelligent job search companion\n\nGet started by configuring your profile and searching for jobs",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         justify="center",
     )
     description.pack(pady=12)
@@ -492,7 +600,7 @@ def show_home_view(window: ctk.CTk) -> None:
     search_frame = ctk.CTkFrame(content_frame, width=600)
     search_frame.pack(pady=20, padx=16)
 
-    search_label = ctk.CTkLabel(search_frame, text="Quick Search", font=ctk.CTkFont(size=14, weight="bold"))
+    search_label = ctk.CTkLabel(search_frame, text="Quick Search", font=get_font(14, "bold"))
     search_label.pack(pady=(12, 10))
 
     # Search inputs
@@ -500,14 +608,13 @@ def show_home_view(window: ctk.CTk) -> None:
     input_frame.pack(pady=12, padx=16)
 
     keyword_entry = ctk.CTkEntry(
-        input_frame, placeholder_text="Job title or keyword", width=300, height=40, font=ctk.CTkFont(size=14)
+        input_frame, placeholder_text="Job title or keyword", width=300, height=40, font=get_font(14)
     )
     keyword_entry.pack(pady=5)
 
     location_var = ctk.StringVar(value="Any Location")
-    location_options = ["Any Location"] + [city["name"] for city in locations.CITY_ID_MAP]
     location_menu = ctk.CTkOptionMenu(
-        input_frame, variable=location_var, values=location_options, width=300, height=40
+        input_frame, variable=location_var, values=LOCATION_OPTIONS, width=300, height=40
     )
     location_menu.pack(pady=5)
 
@@ -517,7 +624,7 @@ def show_home_view(window: ctk.CTk) -> None:
         command=lambda: perform_search(window, keyword_entry.get(), location_var.get()),
         width=300,
         height=40,
-        font=ctk.CTkFont(size=14, weight="bold"),
+        font=get_font(14, "bold"),
     )
     search_button.pack(pady=20)
 
@@ -525,30 +632,65 @@ def show_home_view(window: ctk.CTk) -> None:
     stats_frame = ctk.CTkFrame(content_frame)
     stats_frame.pack(pady=20, padx=16, fill="x")
 
-    stats_label = ctk.CTkLabel(stats_frame, text="Statistics", font=ctk.CTkFont(size=14, weight="bold"))
+    stats_label = ctk.CTkLabel(stats_frame, text="Statistics", font=get_font(14, "bold"))
     stats_label.pack(pady=(12, 10))
 
     stats_container = ctk.CTkFrame(stats_frame, fg_color="transparent")
     stats_container.pack(pady=12, padx=16)
 
-    # Get real stats
-    stats_data = get_user_statistics()
+    # Real stats come from the cache or a background load
     stats = [
-        ("Jobs Saved", str(stats_data["saved_jobs"])),
-        ("Applications", str(stats_data["applications"])),
-        ("Interviews", str(stats_data["interviews"])),
+        ("Jobs Saved", "saved_jobs"),
+        ("Applications", "applications"),
+        ("Interviews", "interviews"),
     ]
 
-    for i, (label, value) in enumerate(stats):
+    window.app_state["stats_labels"] = {}
+    for i, (label, key) in enumerate(stats):
         stat_box = ctk.CTkFrame(stats_container, width=150)
         stat_box.grid(row=0, column=i, padx=10, pady=12)
 
-        value_label = ctk.CTkLabel(stat_box, text=value, font=ctk.CTkFont(size=14, weight="bold"))
+        value_label = ctk.CTkLabel(stat_box, text="...", font=get_font(14, "bold"))
         value_label.pack(pady=(12, 5))
+        window.app_state["stats_labels"][key] = value_label
 
-        label_text = ctk.CTkLabel(stat_box, text=label, font=ctk.CTkFont(size=14), text_color=("gray30", "gray70"))
+        label_text = ctk.CTkLabel(stat_box, text=label, font=get_font(14), text_color=("gray30", "gray70"))
         label_text.pack(pady=(0, 15))
 
+    load_user_statistics(window, lambda stats_data: update_stats_display(window, stats_data))
+
+
+def load_user_statistics(window: ctk.CTk, on_loaded: Callable[[Dict[str, int]], None]) -> None:
+    """
+    Pass user statistics to on_loaded on the main thread.
+
+    Uses orm's cached copy while it is fresh; otherwise the statistics are
+    queried in a background thread.
+    """
+    cached = orm.get_cached_user_statistics()
+    if cached is not None:
+        on_loaded(cached)
+        return
+
+    def stats_thread():
+        try:
+            stats_data = orm.get_user_statistics()
+        except Exception as e:
+            logger.error(f"Failed to load statistics: {e}", exc_info=True)
+            return
+
+        window.after(0, lambda: on_loaded(stats_data))
+
+    thread = threading.Thread(target=stats_thread, daemon=True)
+    thread.start()
+
+
+def update_stats_display(window: ctk.CTk, stats_data: Dict[str, int]) -> None:
+    """Fill the home view statistics labels, if they are still on screen."""
+    for key, value_label in window.app_state["stats_labels"].items():
+        if value_label.winfo_exists():
+            value_label.configure(text=str(stats_data[key]))
+
 
 def show_search_view(window: ctk.CTk) -> None:
     """Display the job search view."""
@@ -560,7 +702,7 @@ def show_search_view(window: ctk.CTk) -> None:
     scroll_frame.pack(pady=12, padx=16, fill="both", expand=True)
 
     # Header
-    header = ctk.CTkLabel(scroll_frame, text="Search Jobs", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(scroll_frame, text="Search Jobs", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
     # Centered search form container
@@ -575,22 +717,21 @@ def show_search_view(window: ctk.CTk) -> None:
     form_container.pack(pady=20, padx=24)
 
     # Keyword field
-    ctk.CTkLabel(form_container, text="Keyword:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Keyword:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     keyword_entry = ctk.CTkEntry(form_container, placeholder_text="e.g., Software Engineer", width=600, height=44)
     keyword_entry.pack(pady=(0, 10))
 
     # Location field with autocomplete
-    ctk.CTkLabel(form_container, text="Location:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Location:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     location_var = ctk.StringVar(value="")
-    location_options = ["Any Location"] + [city["name"] for city in locations.CITY_ID_MAP]
     location_menu = ctk.CTkOptionMenu(
-        form_container, variable=location_var, values=location_options, width=600, height=44
+        form_container, variable=location_var, values=LOCATION_OPTIONS, width=600, height=44
     )
     location_var.set("Any Location")  # Set default
     location_menu.pack(pady=(0, 10))
 
     # Job Type
-    ctk.CTkLabel(form_container, text="Job Type:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Job Type:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     job_type_var = ctk.StringVar(value="")
     job_type_menu = ctk.CTkOptionMenu(
         form_container,
@@ -602,7 +743,7 @@ def show_search_view(window: ctk.CTk) -> None:
     job_type_menu.pack(pady=(0, 10))
 
     # Job Level
-    ctk.CTkLabel(form_container, text="Job Level:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Job Level:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     job_level_var = ctk.StringVar(value="")
     job_level_menu = ctk.CTkOptionMenu(
         form_container, variable=job_level_var, values=["", "Entry", "Mid", "Top"], width=600, height=44
@@ -610,49 +751,49 @@ def show_search_view(window: ctk.CTk) -> None:
     job_level_menu.pack(pady=(0, 10))
 
     # Posted Within
-    ctk.CTkLabel(form_container, text="Posted Within:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Posted Within:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     posted_within_var = ctk.StringVar(value="")
     posted_within_menu = ctk.CTkOptionMenu(
         form_container,
         variable=posted_within_var,
-        values=["", "Today", "Last 2 days", "Last 3 days", "Last 4 days", "Last 5 days"],
+        values=list(_POSTED_MAP),
         width=600,
         height=44,
     )
     posted_within_menu.pack(pady=(0, 10))
 
     # Experience Range
-    ctk.CTkLabel(form_container, text="Experience (Years):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Experience (Years):", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     exp_frame = ctk.CTkFrame(form_container, fg_color="transparent")
     exp_frame.pack(anchor="w", pady=(0, 10))
     
     exp_start_var = ctk.StringVar(value="0")
-    ctk.CTkLabel(exp_frame, text="Min:", font=ctk.CTkFont(size=14)).pack(side="left", padx=(0, 5))
+    ctk.CTkLabel(exp_frame, text="Min:", font=get_font(14)).pack(side="left", padx=(0, 5))
     exp_start_entry = ctk.CTkEntry(exp_frame, textvariable=exp_start_var, width=80, height=44)
     exp_start_entry.pack(side="left", padx=(0, 20))
     
     exp_end_var = ctk.StringVar(value="0")
-    ctk.CTkLabel(exp_frame, text="Max:", font=ctk.CTkFont(size=14)).pack(side="left", padx=(0, 5))
+    ctk.CTkLabel(exp_frame, text="Max:", font=get_font(14)).pack(side="left", padx=(0, 5))
     exp_end_entry = ctk.CTkEntry(exp_frame, textvariable=exp_end_var, width=80, height=44)
     exp_end_entry.pack(side="left")
 
     # Salary Range
-    ctk.CTkLabel(form_container, text="Salary Range (BDT):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Salary Range (BDT):", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     salary_frame = ctk.CTkFrame(form_container, fg_color="transparent")
     salary_frame.pack(anchor="w", pady=(0, 10))
     
     salary_start_var = ctk.StringVar(value="0")
-    ctk.CTkLabel(salary_frame, text="Min:", font=ctk.CTkFont(size=14)).pack(side="left", padx=(0, 5))
+    ctk.CTkLabel(salary_frame, text="Min:", font=get_font(14)).pack(side="left", padx=(0, 5))
     salary_start_entry = ctk.CTkEntry(salary_frame, textvariable=salary_start_var, width=120, height=44)
     salary_start_entry.pack(side="left", padx=(0, 20))
     
     salary_end_var = ctk.StringVar(value="0")
-    ctk.CTkLabel(salary_frame, text="Max:", font=ctk.CTkFont(size=14)).pack(side="left", padx=(0, 5))
+    ctk.CTkLabel(salary_frame, text="Max:", font=get_font(14)).pack(side="left", padx=(0, 5))
     salary_end_entry = ctk.CTkEntry(salary_frame, textvariable=salary_end_var, width=120, height=44)
     salary_end_entry.pack(side="left")
 
     # Workplace (Remote/Work from home)
-    ctk.CTkLabel(form_container, text="Work Arrangement:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 2))
+    ctk.CTkLabel(form_container, text="Work Arrangement:", font=get_font(14)).pack(anchor="w", pady=(0, 2))
     workplace_var = ctk.StringVar(value="")
     workplace_menu = ctk.CTkOptionMenu(
         form_container,
@@ -669,7 +810,7 @@ def show_search_view(window: ctk.CTk) -> None:
         form_container,
         text="Fresher Jobs Only",
         variable=fresher_var,
-        font=ctk.CTkFont(size=14)
+        font=get_font(14)
     )
     fresher_checkbox.pack(anchor="w", pady=(5, 10))
 
@@ -677,7 +818,7 @@ def show_search_view(window: ctk.CTk) -> None:
     search_btn = ctk.CTkButton(
         form_container,
         text="\ud83d\udd0d Search Jobs",
-        command=lambda: perform_advanced_search(
+        command=lambda: perform_search(
             window,
             keyword_entry.get(),
             location_var.get(),
@@ -693,82 +834,12 @@ def show_search_view(window: ctk.CTk) -> None:
         ),
         width=600,
         height=40,
-        font=ctk.CTkFont(size=15, weight="bold"),
+        font=get_font(15, "bold"),
     )
     search_btn.pack(pady=20)
 
 
-def perform_search(window: ctk.CTk, keyword: str, location: str = "", job_type: str = "", job_level: str = "", page: int = 1) -> None:
-    """Execute job search and display results."""
-    if not keyword or not keyword.strip():
-        show_message(window, "Error", "Please enter a keyword to search")
-        return
-
-    # Sanitize parameters - convert None to empty string and handle "Any Location" placeholder
-    location = "" if (location is None or location == "Location" or location == "Any Location") else location
-    job_type = "" if job_type is None else job_type
-    job_level = "" if job_level is None else job_level
-
-    # Store search parameters
-    if page == 1:
-        window.app_state["current_page"] = 1
-        window.app_state["search_params"] = {
-            "keyword": keyword.strip(),
-            "location": location,
-            "job_type": job_type,
-            "job_level": job_level,
-        }
-
-    # Show loading message
-    loading_window = show_loading(window, "Searching for jobs...")
-
-    def search_thread():
-        try:
-            # Get results per page from state
-            per_page = window.app_state.get("results_per_page", 10)
-            
-            # Perform search with API pagination
-            results = scraper.search_jobs(
-                keyword=keyword.strip(),
-                location=location,
-                job_type=job_type,
-                job_level=job_level,
-                page=page,
-                results_per_page=per_page
-            )
-
-            # Store results object (not just jobs)
-            window.app_state["search_results"] = results
-            window.app_state["current_page"] = page
-
-            # Schedule GUI updates on main thread
-            def update_ui():
-                try:
-                    loading_window.destroy()
-                except:
-                    pass
-                show_results_view(window)
-            
-            window.after(0, update_ui)
-
-        except Exception as e:
-            # Schedule error handling on main thread
-            def show_error():
-                try:
-                    loading_window.destroy()
-                except:
-                    pass
-                show_message(window, "Error", f"Search failed: {str(e)}")
-            
-            window.after(0, show_error)
-            logger.error(f"Search error: {e}", exc_info=True)
-
-    # Run search in background thread
-    thread = threading.Thread(target=search_thread, daemon=True)
-    thread.start()
-
-
-def perform_advanced_search(
+def perform_search(
     window: ctk.CTk,
     keyword: str,
     location: str = "",
@@ -781,115 +852,113 @@ def perform_advanced_search(
     salary_end: str = "0",
     workplace: str = "",
     is_fresher: bool = False,
-    page: int = 1
+    page: int = 1,
+    results_per_page: Optional[int] = None,
 ) -> None:
-    """Execute advanced job search with all filters."""
+    """
+    Execute job search with the given filters and display results.
+
+    results_per_page overrides the current page size; like the page number, it
+    is only stored in app_state once the search succeeds.
+    """
     if not keyword or not keyword.strip():
         show_message(window, "Error", "Please enter a keyword to search")
         return
 
-    # Sanitize parameters - convert None to empty string
-    location = "" if location is None else location
-    job_type = "" if job_type is None else job_type
-    job_level = "" if job_level is None else job_level
-    posted_within = "" if posted_within is None else posted_within
-    workplace = "" if workplace is None else workplace
-    exp_start = "0" if exp_start is None else exp_start
-    exp_end = "0" if exp_end is None else exp_end
-    salary_start = "0" if salary_start is None else salary_start
-    salary_end = "0" if salary_end is None else salary_end
+    # Sanitize parameters - fill in defaults for None and drop the "Any Location" placeholder
+    raw_filters = {
+        "location": location,
+        "job_type": job_type,
+        "job_level": job_level,
+        "posted_within": posted_within,
+        "exp_start": exp_start,
+        "exp_end": exp_end,
+        "salary_start": salary_start,
+        "salary_end": salary_end,
+        "workplace": workplace,
+    }
+    filters = {key: _SEARCH_DEFAULTS[key] if value is None else value for key, value in raw_filters.items()}
+    if filters["location"] in ("Location", "Any Location"):
+        filters["location"] = ""
 
     # Convert string inputs to integers
     try:
-        exp_start_int = int(exp_start) if exp_start and exp_start.strip() else 0
-        exp_end_int = int(exp_end) if exp_end and exp_end.strip() else 0
-        salary_start_int = int(salary_start) if salary_start and salary_start.strip() else 0
-        salary_end_int = int(salary_end) if salary_end and salary_end.strip() else 0
+        numbers = {key: int(filters[key].strip() or 0) for key in _INT_FIELDS}
     except ValueError as e:
         show_message(window, "Error", f"Please enter valid numbers for experience and salary: {e}")
         return
 
-    # Map posted_within display text to API values
-    posted_map = {
-        "": "",
-        "Today": "1",
-        "Last 2 days": "2",
-        "Last 3 days": "3",
-        "Last 4 days": "4",
-        "Last 5 days": "5"
-    }
-    posted_within_api = posted_map.get(posted_within, "")
-
-    # Map workplace display text to API values
-    workplace_api = "1" if workplace == "Work from Home" else ""
+    # Map display text to API values
+    posted_within_api = _POSTED_MAP.get(filters["posted_within"], "")
+    workplace_api = _WORKPLACE_MAP.get(filters["workplace"], "")
 
-    # Store search parameters
+    # Store search parameters (always the full set, so paging can replay them as-is)
     if page == 1:
-        window.app_state["current_page"] = 1
-        window.app_state["search_params"] = {
-            "keyword": keyword.strip(),
-            "location": location,
-            "job_type": job_type,
-            "job_level": job_level,
-            "posted_within": posted_within,
-            "exp_start": exp_start,
-            "exp_end": exp_end,
-            "salary_start": salary_start,
-            "salary_end": salary_end,
-            "workplace": workplace,
-            "is_fresher": is_fresher,
-        }
+        window.app_state["search_params"] = {"keyword": keyword.strip(), **filters, "is_fresher": is_fresher}
+
+    # A newer search supersedes any still in flight; only the latest one gets displayed
+    window.app_state["search_generation"] += 1
+    generation = window.app_state["search_generation"]
+    set_pagination_enabled(window, False)
 
     # Show loading message
-    loading_window = show_loading(window, "Searching for jobs...")
+    show_loading(window, "Searching for jobs...")
+
+    per_page = results_per_page or window.app_state.get("results_per_page", 10)
 
     def search_thread():
         try:
-            # Get results per page from state
-            per_page = window.app_state.get("results_per_page", 10)
-            
             # Perform search with API pagination
             results = scraper.search_jobs(
                 keyword=keyword.strip(),
-                location=location,
-                job_type=job_type,
-                job_level=job_level,
+                location=filters["location"],
+                job_type=filters["job_type"],
+                job_level=filters["job_level"],
                 posted_within=posted_within_api,
-                experience_start=exp_start_int,
-                experience_end=exp_end_int,
-                salary_start=salary_start_int,
-                salary_end=salary_end_int,
+                experience_start=numbers["exp_start"],
+                experience_end=numbers["exp_end"],
+                salary_start=numbers["salary_start"],
+                salary_end=numbers["salary_end"],
                 workplace=workplace_api,
                 is_fresher=is_fresher,
                 page=page,
-                results_per_page=per_page
+                results_per_page=per_page,
+                client=window.app_state["http_client"],
             )
 
-            # Store results object
-            window.app_state["search_results"] = results
-            window.app_state["current_page"] = page
-
             # Schedule GUI updates on main thread
             def update_ui():
-                try:
-                    loading_window.destroy()
-                except:
-                    pass
-                show_results_view(window)
+                # A superseded search leaves the loading dialog to the one that replaced it
+                if generation != window.app_state["search_generation"]:
+                    return
+                hide_loading(window)
+
+                # Store results object
+                window.app_state["search_results"] = results
+                window.app_state["current_page"] = page
+                window.app_state["results_per_page"] = per_page
+                if window.app_state["current_view"] == "results":
+                    # Paging or resizing: keep the view and swap in the new page
+                    populate_results(window)
+                else:
+                    show_results_view(window)
             
             window.after(0, update_ui)
 
         except Exception as e:
             # Schedule error handling on main thread
             def show_error():
-                try:
-                    loading_window.destroy()
-                except:
-                    pass
+                if generation != window.app_state["search_generation"]:
+                    return
+                hide_loading(window)
+                set_pagination_enabled(window, True)
+                if window.app_state["current_view"] == "results" and window.app_state["per_page_var"]:
+                    # The old page is still shown, so the selector goes back to its size
+                    window.app_state["per_page_var"].set(str(window.app_state["results_per_page"]))
                 show_message(window, "Error", f"Search failed: {str(e)}")
             
             window.after(0, show_error)
-            logger.error(f"Advanced search error: {e}", exc_info=True)
+            logger.error(f"Search error: {e}", exc_info=True)
 
     # Run search in background thread
     thread = threading.Thread(target=search_thread, daemon=True)
@@ -900,28 +969,19 @@ def show_results_view(window: ctk.CTk) -> None:
     """Display search results with pagination."""
     content_frame = clear_content(window)
     window.app_state["current_view"] = "results"
+    window.app_state["pagination_buttons"] = []
 
     results = window.app_state.get("search_results")
     if not results:
         return
-    
-    current_page = window.app_state.get("current_page", 1)
+
     per_page = window.app_state.get("results_per_page", 10)
-    
-    # Get data from API results
-    total_jobs = results.common.total_records_found  # Total across all pages
-    page_jobs = results.all_jobs  # Jobs in current page
-    total_pages = max(1, results.common.totalpages)  # Use API's total pages
 
     # Header
     header_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
     header_frame.pack(fill="x", pady=(12, 10), padx=16)
 
-    header = ctk.CTkLabel(
-        header_frame,
-        text=f"Search Results ({total_jobs} jobs found)",
-        font=ctk.CTkFont(size=14, weight="bold"),
-    )
+    header = ctk.CTkLabel(header_frame, text="", font=get_font(14, "bold"))
     header.pack(side="left")
 
     # Results per page selector
@@ -931,13 +991,13 @@ def show_results_view(window: ctk.CTk) -> None:
     ctk.CTkLabel(
         per_page_frame,
         text="Show:",
-        font=ctk.CTkFont(size=14)
+        font=get_font(14)
     ).pack(side="left", padx=(0, 5))
     
-    per_page_var = ctk.StringVar(value=str(per_page))
+    window.app_state["per_page_var"] = ctk.StringVar(value=str(per_page))
     per_page_menu = ctk.CTkOptionMenu(
         per_page_frame,
-        variable=per_page_var,
+        variable=window.app_state["per_page_var"],
         values=["5", "10", "20", "50"],
         command=lambda choice: change_results_per_page(window, int(choice)),
         width=80,
@@ -950,166 +1010,292 @@ def show_results_view(window: ctk.CTk) -> None:
     )
     back_btn.pack(side="right", padx=10)
 
-    # Pagination info (always show)
+    # Pagination info (always show): page controls, or a summary line when there is a single page.
+    # Both page labels display one shared variable.
+    window.app_state["page_var"] = ctk.StringVar(value="")
     pagination_top = ctk.CTkFrame(content_frame, fg_color=("gray85", "gray20"))
     pagination_top.pack(fill="x", pady=(10, 10), padx=16)
-    
+    top_controls = create_pagination_controls(pagination_top, window)
+    page_info = ctk.CTkLabel(pagination_top, text="", font=get_font(16, "bold"))
+
+    # Pagination controls (bottom), packed below the results list when there are several pages
+    pagination_bottom = ctk.CTkFrame(content_frame, fg_color=("gray85", "gray20"))
+    bottom_controls = create_pagination_controls(pagination_bottom, window)
+    bottom_controls.pack(pady=10)
+
+    window.app_state["results_widgets"] = {
+        "content_frame": content_frame,
+        "header": header,
+        "pagination_top": pagination_top,
+        "top_controls": top_controls,
+        "page_info": page_info,
+        "pagination_bottom": pagination_bottom,
+        "results_scroll": None,
+    }
+    populate_results(window)
+
+
+def populate_results(window: ctk.CTk) -> None:
+    """
+    Fill the results view with the current page of search results.
+
+    The header, page size selector and pagination frames built by
+    show_results_view stay in place; only their texts and button states
+    are updated, and the job list is swapped for a new one.
+    """
+    widgets = window.app_state["results_widgets"]
+    results = window.app_state["search_results"]
+    current_page = window.app_state.get("current_page", 1)
+
+    # Get data from API results
+    total_jobs = results.common.total_records_found  # Total across all pages
+    page_jobs = results.all_jobs  # Jobs in current page
+    total_pages = max(1, results.common.totalpages)  # Use API's total pages
+
+    widgets["header"].configure(text=f"Search Results ({total_jobs} jobs found)")
+
     if total_pages > 1:
-        create_pagination_controls(pagination_top, window, current_page, total_pages)
+        widgets["page_info"].pack_forget()
+        widgets["top_controls"].pack(pady=10)
+        window.app_state["page_var"].set(f"Page {current_page} of {total_pages}")
+        set_pagination_enabled(window, True)
     else:
-        # Show page info even with single page
-        page_info = ctk.CTkLabel(
-            pagination_top,
-            text=f"Showing all {total_jobs} results (Page 1 of 1)",
-            font=ctk.CTkFont(size=16, weight="bold")
-        )
-        page_info.pack(pady=12)
-
-    # Results list (scrollable)
-    results_scroll = ctk.CTkScrollableFrame(content_frame, width=1200, height=550)
-    results_scroll.pack(pady=5, padx=16, fill="both", expand=True)
+        widgets["top_controls"].pack_forget()
+        widgets["page_info"].configure(text=f"Showing all {total_jobs} results (Page 1 of 1)")
+        widgets["page_info"].pack(pady=12)
+
+    # Results list (scrollable). A fresh frame per page also starts scrolled to the top.
+    old_scroll = widgets["results_scroll"]
+    if old_scroll is not None:
+        old_scroll.pack_forget()
+        window.after_idle(destroy_widgets, [old_scroll])
+    results_scroll = ctk.CTkScrollableFrame(widgets["content_frame"], width=1200, height=550)
+    results_scroll.pack(after=widgets["pagination_top"], pady=5, padx=16, fill="both", expand=True)
+    # Cards are gridded one per row; adding a row does not re-lay out the ones above it
+    results_scroll.columnconfigure(0, weight=1)
+    widgets["results_scroll"] = results_scroll
+
+    if page_jobs and total_pages > 1:
+        widgets["pagination_bottom"].pack(fill="x", pady=(10, 12), padx=16)
+    else:
+        widgets["pagination_bottom"].pack_forget()
 
     if not page_jobs:
         no_results = ctk.CTkLabel(
             results_scroll,
             text="No jobs found. Try different keywords or filters.",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=("gray30", "gray70"),
         )
-        no_results.pack(pady=50)
+        no_results.grid(row=0, column=0, pady=50)
         return
 
     # Display current page jobs
-    for job in page_jobs:
-        create_job_card(results_scroll, job, window)
-    
-    # Pagination controls (bottom) - always show for consistency
-    if total_pages > 1:
-        pagination_bottom = ctk.CTkFrame(content_frame, fg_color=("gray85", "gray20"))
-        pagination_bottom.pack(fill="x", pady=(10, 12), padx=16)
-        create_pagination_controls(pagination_bottom, window, current_page, total_pages)
+    render_job_cards(results_scroll, page_jobs, window)
+
 
+def render_job_cards(results_scroll: ctk.CTkScrollableFrame, jobs: List[Any], window: ctk.CTk) -> None:
+    """
+    Build job cards only as they are about to come into view.
+
+    The first screenful is created immediately; further cards are added in
+    small batches, one per frame, whenever the visible region nears the end
+    of what has been built so far.
+    """
+    render_cards_in_batches(
+        window, results_scroll, jobs, lambda index, job: create_job_card(results_scroll, job, window, index)
+    )
 
-def create_pagination_controls(parent: ctk.CTkFrame, window: ctk.CTk, current_page: int, total_pages: int) -> None:
-    """Create pagination controls."""
+
+def render_cards_in_batches(
+    window: ctk.CTk,
+    container: ctk.CTkScrollableFrame,
+    items: List[Any],
+    create_card: Callable[[int, Any], None],
+    on_done: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Call create_card(index, item) for each item as the list scrolls toward it.
+
+    RESULTS_FIRST_BATCH items are created at once. After that, a batch of
+    RESULTS_BATCH_SIZE is added (at most one per frame) whenever the visible
+    region reaches RESULTS_PREFETCH_THRESHOLD of what has been built.
+    Stops early if the container is destroyed (the view was left); otherwise
+    on_done runs after the last batch.
+    """
+    rendered = 0
+    pending = False
+
+    # CTkScrollableFrame reports every view change to its scrollbar; tap into that to track the viewport
+    canvas = container._parent_canvas
+    scrollbar = container._scrollbar
+
+    def render_batch(count: int) -> None:
+        nonlocal rendered, pending
+        pending = False
+        # The view may have been left before all batches ran
+        if not container.winfo_exists():
+            return
+
+        end = min(rendered + count, len(items))
+        for index, item in enumerate(items[rendered:end], rendered):
+            create_card(index, item)
+        rendered = end
+
+        if rendered >= len(items):
+            # Everything is built; hand scroll updates straight back to the scrollbar
+            canvas.configure(yscrollcommand=scrollbar.set)
+            if on_done is not None:
+                on_done()
+
+    def on_view_change(first: str, last: str) -> None:
+        nonlocal pending
+        scrollbar.set(first, last)
+        # A list shorter than the viewport reports last == 1.0, so it keeps filling until the view is full
+        if not pending and rendered < len(items) and float(last) >= RESULTS_PREFETCH_THRESHOLD:
+            pending = True
+            window.after(RESULTS_BATCH_DELAY_MS, render_batch, RESULTS_BATCH_SIZE)
+
+    canvas.configure(yscrollcommand=on_view_change)
+    render_batch(RESULTS_FIRST_BATCH)
+
+
+def render_list_page(
+    window: ctk.CTk,
+    container: ctk.CTkScrollableFrame,
+    rows: List[Any],
+    fetch_page: Callable[[Optional[int], int], List[Any]],
+    create_card: Callable[[Any], None],
+) -> None:
+    """
+    Draw one page of a long list and, if more rows exist, a "Load more" button for the next page.
+
+    rows holds up to LIST_PAGE_SIZE + 1 rows as returned by fetch_page(before_id, limit),
+    newest (highest id) first; the extra row only signals that another page exists.
+    The next page continues below the last shown id, so cards removed in the
+    meantime do not shift it.
+    """
+    has_more = len(rows) > LIST_PAGE_SIZE
+    rows = rows[:LIST_PAGE_SIZE]
+
+    def add_load_more() -> None:
+        if not has_more:
+            return
+
+        def load_more() -> None:
+            load_more_btn.destroy()
+            next_rows = fetch_page(rows[-1].id, LIST_PAGE_SIZE + 1)
+            render_list_page(window, container, next_rows, fetch_page, create_card)
+
+        load_more_btn = ctk.CTkButton(
+            container, text="Load more", command=load_more, width=200, height=40, font=get_font(14)
+        )
+        load_more_btn.pack(pady=12)
+
+    render_cards_in_batches(window, container, rows, lambda _index, row: create_card(row), add_load_more)
+
+
+def create_pagination_controls(parent: ctk.CTkFrame, window: ctk.CTk) -> ctk.CTkFrame:
+    """
+    Create Previous/Next pagination controls and return their (unpacked) frame.
+
+    The buttons act relative to the page shown when they are clicked, so the
+    same controls serve every page of a search.
+    """
     pagination_frame = ctk.CTkFrame(parent, fg_color="transparent")
-    pagination_frame.pack(pady=10)
     
     # Previous button
     prev_btn = ctk.CTkButton(
         pagination_frame,
         text="← Previous",
-        command=lambda: go_to_page(window, current_page - 1),
+        command=lambda: go_to_page(window, window.app_state["current_page"] - 1),
         width=120,
         height=40,
-        state="normal" if current_page > 1 else "disabled",
-        font=ctk.CTkFont(size=14)
+        font=get_font(14)
     )
     prev_btn.pack(side="left", padx=8)
     
     # Page info
-    page_label = ctk.CTkLabel(
-        pagination_frame,
-        text=f"Page {current_page} of {total_pages}",
-        font=ctk.CTkFont(size=16, weight="bold")
-    )
+    page_label = ctk.CTkLabel(pagination_frame, textvariable=window.app_state["page_var"], font=get_font(16, "bold"))
     page_label.pack(side="left", padx=20)
     
     # Next button
     next_btn = ctk.CTkButton(
         pagination_frame,
         text="Next →",
-        command=lambda: go_to_page(window, current_page + 1),
+        command=lambda: go_to_page(window, window.app_state["current_page"] + 1),
         width=120,
         height=40,
-        state="normal" if current_page < total_pages else "disabled",
-        font=ctk.CTkFont(size=14)
+        font=get_font(14)
     )
     next_btn.pack(side="left", padx=8)
 
+    window.app_state["pagination_buttons"].append((prev_btn, next_btn))
+    return pagination_frame
+
+
+def set_pagination_enabled(window: ctk.CTk, enabled: bool) -> None:
+    """Enable or disable the results view's Previous/Next buttons (within the page bounds)."""
+    results = window.app_state.get("search_results")
+    current_page = window.app_state.get("current_page", 1)
+    total_pages = max(1, results.common.totalpages) if results else 1
+
+    for prev_btn, next_btn in window.app_state["pagination_buttons"]:
+        if prev_btn.winfo_exists():
+            prev_btn.configure(state="normal" if enabled and current_page > 1 else "disabled")
+        if next_btn.winfo_exists():
+            next_btn.configure(state="normal" if enabled and current_page < total_pages else "disabled")
+
 
 def go_to_page(window: ctk.CTk, page: int) -> None:
     """Navigate to a specific page by fetching from API."""
     params = window.app_state.get("search_params", {})
     if params:
-        # Check if advanced search parameters exist
-        if "posted_within" in params:
-            perform_advanced_search(
-                window,
-                params.get("keyword", ""),
-                params.get("location", ""),
-                params.get("job_type", ""),
-                params.get("job_level", ""),
-                params.get("posted_within", ""),
-                params.get("exp_start", "0"),
-                params.get("exp_end", "0"),
-                params.get("salary_start", "0"),
-                params.get("salary_end", "0"),
-                params.get("workplace", ""),
-                params.get("is_fresher", False),
-                page=page
-            )
-        else:
-            perform_search(
-                window,
-                params.get("keyword", ""),
-                params.get("location", ""),
-                params.get("job_type", ""),
-                params.get("job_level", ""),
-                page=page
-            )
+        perform_search(window, **params, page=page)
 
 
 def change_results_per_page(window: ctk.CTk, new_per_page: int) -> None:
     """Change the number of results displayed per page."""
-    window.app_state["results_per_page"] = new_per_page
-    window.app_state["current_page"] = 1
-    # Re-fetch from API with new page size
+    results = window.app_state.get("search_results")
+    shown_page = window.app_state.get("current_page", 1)
+
+    # Shrinking the page size while on page 1: the new first page is already loaded
+    if results and shown_page == 1 and new_per_page <= results.total_results:
+        kept_data = results.data[:new_per_page]
+        kept_premium = results.premiumData[: new_per_page - len(kept_data)]
+        total_pages = -(-results.common.total_records_found // new_per_page)
+        window.app_state["search_results"] = results.model_copy(
+            update={
+                "data": kept_data,
+                "premiumData": kept_premium,
+                "common": results.common.model_copy(update={"totalpages": total_pages}),
+            }
+        )
+        window.app_state["results_per_page"] = new_per_page
+        populate_results(window)
+        return
+
+    # Re-fetch from API with new page size; it only takes effect once the fetch succeeds
     params = window.app_state.get("search_params", {})
     if params:
-        # Check if advanced search parameters exist
-        if "posted_within" in params:
-            perform_advanced_search(
-                window,
-                params.get("keyword", ""),
-                params.get("location", ""),
-                params.get("job_type", ""),
-                params.get("job_level", ""),
-                params.get("posted_within", ""),
-                params.get("exp_start", "0"),
-                params.get("exp_end", "0"),
-                params.get("salary_start", "0"),
-                params.get("salary_end", "0"),
-                params.get("workplace", ""),
-                params.get("is_fresher", False),
-                page=1
-            )
-        else:
-            perform_search(
-                window,
-                params.get("keyword", ""),
-                params.get("location", ""),
-                params.get("job_type", ""),
-                params.get("job_level", ""),
-                page=1
-        )
+        perform_search(window, **params, page=1, results_per_page=new_per_page)
 
 
-def create_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
-    """Create a job card widget."""
+def create_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk, index: int) -> None:
+    """Create a job card widget for the search result at the given index, in grid row ``index``."""
     card = ctk.CTkFrame(parent, corner_radius=10)
-    card.pack(pady=12, padx=16, fill="x")
+    card.grid(row=index, column=0, sticky="ew", pady=12, padx=16)
 
     # Job content frame
     content = ctk.CTkFrame(card, fg_color="transparent")
     content.pack(fill="both", expand=True, padx=16, pady=20)
 
     # Title and company
-    title_label = ctk.CTkLabel(content, text=job.jobTitle, font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+    title_label = ctk.CTkLabel(content, text=job.jobTitle, font=get_font(14, "bold"), anchor="w")
     title_label.pack(anchor="w", pady=(0, 5))
 
     company_label = ctk.CTkLabel(
-        content, text=f"\ud83c\udfe2 {job.companyName}", font=ctk.CTkFont(size=14), text_color="gray70", anchor="w"
+        content, text=f"\ud83c\udfe2 {job.companyName}", font=get_font(14), text_color="gray70", anchor="w"
     )
     company_label.pack(anchor="w", pady=(0, 10))
 
@@ -1117,27 +1303,24 @@ def create_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
     details_frame = ctk.CTkFrame(content, fg_color="transparent")
     details_frame.pack(fill="x", pady=(0, 10))
 
+    # Location and experience share one label; emoji glyphs are the costly part to lay out
+    details = []
     if job.location:
-        loc_label = ctk.CTkLabel(
-            details_frame,
-            text=f"\ud83d\udccd {job.location}",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray30", "gray70"),
-        )
-        loc_label.pack(side="left", padx=(0, 20))
-
+        details.append(f"\ud83d\udccd {job.location}")
     if job.experience:
-        exp_label = ctk.CTkLabel(
+        details.append(f"\ud83d\udcbc {job.experience}")
+    if details:
+        details_label = ctk.CTkLabel(
             details_frame,
-            text=f"\ud83d\udcbc {job.experience}",
-            font=ctk.CTkFont(size=14),
+            text="    ".join(details),
+            font=get_font(14),
             text_color=("gray30", "gray70"),
         )
-        exp_label.pack(side="left", padx=(0, 20))
+        details_label.pack(side="left", padx=(0, 20))
 
     if job.deadline:
         deadline_label = ctk.CTkLabel(
-            details_frame, text=f"\u23f0 Deadline: {job.deadline}", font=ctk.CTkFont(size=14), text_color="orange"
+            details_frame, text=f"\u23f0 Deadline: {job.deadline}", font=get_font(14), text_color="orange"
         )
         deadline_label.pack(side="left")
 
@@ -1148,20 +1331,20 @@ def create_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
     view_btn = ctk.CTkButton(
         button_frame,
         text="\ud83d\udd17 View Details",
-        command=lambda j=job: webbrowser.open(j.get_job_url()),
+        command=partial(on_view_result, window, index),
         width=130,
         height=40,
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
     )
     view_btn.pack(side="left", padx=(0, 10))
 
     save_btn = ctk.CTkButton(
         button_frame,
         text="\u2b50 Save Job",
-        command=lambda j=job: save_job_to_db(window, j),
+        command=partial(on_save_result, window, index),
         width=120,
         height=40,
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         fg_color="green",
         hover_color="darkgreen",
     )
@@ -1170,50 +1353,91 @@ def create_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
     apply_btn = ctk.CTkButton(
         button_frame,
         text="\u2713 Mark Applied",
-        command=lambda j=job: mark_job_applied(window, j),
+        command=partial(on_apply_result, window, index),
         width=130,
         height=40,
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         fg_color="blue",
         hover_color="darkblue",
     )
     apply_btn.pack(side="left")
 
 
+def get_result_job(window: ctk.CTk, index: int):
+    """Get the job at the given index of the displayed search results."""
+    return window.app_state["search_results"].all_jobs[index]
+
+
+def on_view_result(window: ctk.CTk, index: int) -> None:
+    """Open a search result's detail page in the browser."""
+    webbrowser.open(get_result_job(window, index).job_url)
+
+
+def on_save_result(window: ctk.CTk, index: int) -> None:
+    """Save a search result to the database."""
+    save_job_to_db(window, get_result_job(window, index))
+
+
+def on_apply_result(window: ctk.CTk, index: int) -> None:
+    """Mark a search result as applied."""
+    mark_job_applied(window, get_result_job(window, index))
+
+
 def show_saved_jobs_view(window: ctk.CTk) -> None:
     """Display saved jobs."""
     content_frame = clear_content(window)
     window.app_state["current_view"] = "saved"
 
     # Header
-    header = ctk.CTkLabel(content_frame, text="Saved Jobs", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(content_frame, text="Saved Jobs", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
-    # Get saved jobs from database
-    session = orm.get_session()
-    try:
-        jobs = session.query(orm.Job).filter_by(is_active=True).order_by(orm.Job.created_at.desc()).all()
-
-        if not jobs:
-            no_jobs = ctk.CTkLabel(
-                content_frame,
-                text="No saved jobs yet.\n\nSearch for jobs and save your favorites!",
-                font=ctk.CTkFont(size=14),
-                text_color=("gray30", "gray70"),
-                justify="center",
-            )
-            no_jobs.pack(pady=120)
-            return
+    jobs = fetch_saved_jobs(None, LIST_PAGE_SIZE + 1)
 
-        # Results list
-        results_scroll = ctk.CTkScrollableFrame(content_frame, width=1200, height=700)
-        results_scroll.pack(pady=12, padx=16, fill="both", expand=True)
+    if not jobs:
+        no_jobs = ctk.CTkLabel(
+            content_frame,
+            text="No saved jobs yet.\n\nSearch for jobs and save your favorites!",
+            font=get_font(14),
+            text_color=("gray30", "gray70"),
+            justify="center",
+        )
+        no_jobs.pack(pady=120)
+        return
 
-        for job in jobs:
-            create_saved_job_card(results_scroll, job, window)
+    # Results list
+    results_scroll = ctk.CTkScrollableFrame(content_frame, width=1200, height=700)
+    results_scroll.pack(pady=12, padx=16, fill="both", expand=True)
 
-    finally:
-        session.close()
+    render_list_page(
+        window,
+        results_scroll,
+        jobs,
+        fetch_saved_jobs,
+        lambda job: create_saved_job_card(results_scroll, job, window),
+    )
+
+
+def fetch_saved_jobs(before_id: Optional[int], limit: int) -> List[Any]:
+    """Get a page of saved jobs, newest first and below before_id if given (only the columns the cards show)."""
+    query = (
+        select(
+            orm.Job.id,
+            orm.Job.title,
+            orm.Job.company,
+            orm.Job.location,
+            orm.Job.salary_range,
+            orm.Job.url,
+        )
+        .where(orm.Job.is_active.is_(True))
+        .order_by(orm.Job.id.desc())  # ids follow creation order
+        .limit(limit)
+    )
+    if before_id is not None:
+        query = query.where(orm.Job.id < before_id)
+
+    with orm.assert_max_queries(1, "fetch_saved_jobs"), orm.session_scope() as session:
+        return session.execute(query).all()
 
 
 def create_saved_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
@@ -1225,12 +1449,12 @@ def create_saved_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
     content.pack(fill="both", expand=True, padx=16, pady=20)
 
     # Title
-    title_label = ctk.CTkLabel(content, text=job.title, font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+    title_label = ctk.CTkLabel(content, text=job.title, font=get_font(14, "bold"), anchor="w")
     title_label.pack(anchor="w", pady=(0, 5))
 
     # Company
     company_label = ctk.CTkLabel(
-        content, text=f"\ud83c\udfe2 {job.company}", font=ctk.CTkFont(size=14), text_color="gray70", anchor="w"
+        content, text=f"\ud83c\udfe2 {job.company}", font=get_font(14), text_color="gray70", anchor="w"
     )
     company_label.pack(anchor="w", pady=(0, 10))
 
@@ -1243,7 +1467,7 @@ def create_saved_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
             details_text += f"\ud83d\udcb5 {job.salary_range}"
 
         details_label = ctk.CTkLabel(
-            content, text=details_text, font=ctk.CTkFont(size=14), text_color=("gray30", "gray70")
+            content, text=details_text, font=get_font(14), text_color=("gray30", "gray70")
         )
         details_label.pack(anchor="w", pady=(0, 10))
 
@@ -1253,16 +1477,22 @@ def create_saved_job_card(parent: ctk.CTkFrame, job, window: ctk.CTk) -> None:
 
     if job.url:
         view_btn = ctk.CTkButton(
-            button_frame, text="\ud83d\udd17 View Job", command=lambda: webbrowser.open(job.url), width=120, height=40
+            button_frame,
+            text="\ud83d\udd17 View Job",
+            command=lambda: webbrowser.open(job.url),
+            width=120,
+            height=40,
+            font=get_font(13),
         )
         view_btn.pack(side="left", padx=(0, 10))
 
     remove_btn = ctk.CTkButton(
         button_frame,
         text="\u274c Remove",
-        command=lambda j_id=job.id: remove_saved_job(window, j_id),
+        command=lambda j_id=job.id: remove_saved_job(window, j_id, card),
         width=100,
         height=40,
+        font=get_font(13),
         fg_color="red",
         hover_color="darkred",
     )
@@ -1275,43 +1505,48 @@ def show_applications_view(window: ctk.CTk) -> None:
     window.app_state["current_view"] = "applications"
 
     # Header
-    header = ctk.CTkLabel(content_frame, text="My Applications", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(content_frame, text="My Applications", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
-    # Get applications
-    session = orm.get_session()
-    try:
-        applications = (
-            session.query(orm.JobApplication, orm.Job)
-            .join(orm.Job)
-            .order_by(orm.JobApplication.created_at.desc())
-            .all()
+    applications = fetch_applications(None, LIST_PAGE_SIZE + 1)
+
+    if not applications:
+        no_apps = ctk.CTkLabel(
+            content_frame,
+            text="No applications yet.\n\nMark jobs as applied to track them here!",
+            font=get_font(14),
+            text_color=("gray30", "gray70"),
+            justify="center",
         )
+        no_apps.pack(pady=120)
+        return
 
-        if not applications:
-            no_apps = ctk.CTkLabel(
-                content_frame,
-                text="No applications yet.\n\nMark jobs as applied to track them here!",
-                font=ctk.CTkFont(size=14),
-                text_color=("gray30", "gray70"),
-                justify="center",
-            )
-            no_apps.pack(pady=120)
-            return
+    # Applications list
+    apps_scroll = ctk.CTkScrollableFrame(content_frame, width=1200, height=700)
+    apps_scroll.pack(pady=12, padx=16, fill="both", expand=True)
 
-        # Applications list
-        apps_scroll = ctk.CTkScrollableFrame(content_frame, width=1200, height=700)
-        apps_scroll.pack(pady=12, padx=16, fill="both", expand=True)
+    render_list_page(
+        window,
+        apps_scroll,
+        applications,
+        fetch_applications,
+        lambda app: create_application_card(apps_scroll, app, window),
+    )
 
-        for app, job in applications:
-            create_application_card(apps_scroll, app, job, window)
 
-    finally:
-        session.close()
+def fetch_applications(before_id: Optional[int], limit: int) -> List[Any]:
+    """Get a page of applications, newest first and below before_id if given, each with its job loaded."""
+    # Closing the session detaches the applications; cards only read what was loaded here
+    with orm.assert_max_queries(1, "fetch_applications"), orm.session_scope() as session:
+        query = session.query(orm.JobApplication).options(joinedload(orm.JobApplication.job))
+        if before_id is not None:
+            query = query.filter(orm.JobApplication.id < before_id)
+        return query.order_by(orm.JobApplication.id.desc()).limit(limit).all()  # ids follow creation order
 
 
-def create_application_card(parent: ctk.CTkFrame, app, job, window: ctk.CTk) -> None:
+def create_application_card(parent: ctk.CTkFrame, app, window: ctk.CTk) -> None:
     """Create an application card widget."""
+    job = app.job
     card = ctk.CTkFrame(parent, corner_radius=10)
     card.pack(pady=12, padx=16, fill="x")
 
@@ -1319,7 +1554,7 @@ def create_application_card(parent: ctk.CTkFrame, app, job, window: ctk.CTk) ->
     content.pack(fill="both", expand=True, padx=16, pady=20)
 
     # Job title
-    title_label = ctk.CTkLabel(content, text=job.title, font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+    title_label = ctk.CTkLabel(content, text=job.title, font=get_font(14, "bold"), anchor="w")
     title_label.pack(anchor="w", pady=(0, 5))
 
     # Company and status
@@ -1327,23 +1562,16 @@ def create_application_card(parent: ctk.CTkFrame, app, job, window: ctk.CTk) ->
     info_frame.pack(fill="x", pady=(0, 10))
 
     company_label = ctk.CTkLabel(
-        info_frame, text=f"\ud83c\udfe2 {job.company}", font=ctk.CTkFont(size=14), text_color="gray70"
+        info_frame, text=f"\ud83c\udfe2 {job.company}", font=get_font(14), text_color="gray70"
     )
     company_label.pack(side="left", padx=(0, 20))
 
-    status_colors = {
-        "interested": "orange",
-        "applied": "blue",
-        "interview": "purple",
-        "rejected": "red",
-        "accepted": "green",
-    }
-    status_color = status_colors.get(app.status, "gray")
+    status_color = STATUS_COLORS.get(app.status, "gray")
 
     status_label = ctk.CTkLabel(
         info_frame,
         text=f"\u25cf {app.status.title()}",
-        font=ctk.CTkFont(size=14, weight="bold"),
+        font=get_font(14, "bold"),
         text_color=status_color,
     )
     status_label.pack(side="left")
@@ -1352,14 +1580,14 @@ def create_application_card(parent: ctk.CTkFrame, app, job, window: ctk.CTk) ->
     date_label = ctk.CTkLabel(
         content,
         text=f"Added: {app.created_at.strftime('%b %d, %Y')}",
-        font=ctk.CTkFont(size=14),
+        font=get_font(14),
         text_color=("gray30", "gray70"),
     )
     date_label.pack(anchor="w", pady=(0, 10))
 
     # Notes if available
     if app.notes:
-        notes_label = ctk.CTkLabel(content, text=f"Notes: {app.notes}", font=ctk.CTkFont(size=14), anchor="w")
+        notes_label = ctk.CTkLabel(content, text=f"Notes: {app.notes}", font=get_font(14), anchor="w")
         notes_label.pack(anchor="w", pady=(0, 10))
 
     # Buttons
@@ -1368,7 +1596,12 @@ def create_application_card(parent: ctk.CTkFrame, app, job, window: ctk.CTk) ->
 
     if job.url:
         view_btn = ctk.CTkButton(
-            button_frame, text="\ud83d\udd17 View Job", command=lambda: webbrowser.open(job.url), width=120, height=40
+            button_frame,
+            text="\ud83d\udd17 View Job",
+            command=lambda: webbrowser.open(job.url),
+            width=120,
+            height=40,
+            font=get_font(13),
         )
         view_btn.pack(side="left", padx=(0, 10))
 
@@ -1391,11 +1624,13 @@ def show_dashboard_view(window: ctk.CTk) -> None:
     window.app_state["current_view"] = "dashboard"
 
     # Header
-    header = ctk.CTkLabel(content_frame, text="Dashboard", font=ctk.CTkFont(size=48, weight="bold"))
+    header = ctk.CTkLabel(content_frame, text="Dashboard", font=get_font(48, "bold"))
     header.pack(pady=(12, 20))
 
-    # Get statistics
-    stats = get_user_statistics()
+    # Get statistics and recent activity, sharing one session
+    with orm.assert_max_queries(2, "dashboard"), orm.session_scope() as session:
+        stats = orm.get_user_statistics(session)
+        recent = orm.get_recent_activity(limit=5, session=session)
 
     # Scrollable container for dashboard content
     scroll_frame = ctk.CTkScrollableFrame(content_frame, width=1200, height=700)
@@ -1418,51 +1653,41 @@ def show_dashboard_view(window: ctk.CTk) -> None:
         stat_box.grid_propagate(False)
 
         value_label = ctk.CTkLabel(
-            stat_box, text=str(value), font=ctk.CTkFont(size=48, weight="bold"), text_color="white"
+            stat_box, text=str(value), font=get_font(48, "bold"), text_color="white"
         )
         value_label.pack(pady=(25, 5))
 
-        label_text = ctk.CTkLabel(stat_box, text=label, font=ctk.CTkFont(size=14), text_color="white")
+        label_text = ctk.CTkLabel(stat_box, text=label, font=get_font(14), text_color="white")
         label_text.pack()
 
     stats_grid.grid_columnconfigure(0, weight=1)
     stats_grid.grid_columnconfigure(1, weight=1)
 
     # Recent activity
-    activity_label = ctk.CTkLabel(scroll_frame, text="Recent Activity", font=ctk.CTkFont(size=14, weight="bold"))
+    activity_label = ctk.CTkLabel(scroll_frame, text="Recent Activity", font=get_font(14, "bold"))
     activity_label.pack(pady=(12, 20))
 
     activity_frame = ctk.CTkFrame(scroll_frame, width=900)
     activity_frame.pack(pady=12, padx=100, fill="x")
 
     # Show recent applications
-    session = orm.get_session()
-    try:
-        recent = (
-            session.query(orm.JobApplication, orm.Job)
-            .join(orm.Job)
-            .order_by(orm.JobApplication.created_at.desc())
-            .limit(5)
-            .all()
-        )
-
-        if recent:
-            for app, job in recent:
-                activity_item = ctk.CTkLabel(
-                    activity_frame,
-                    text=f"\u2022 {app.status.title()}: {job.title} at {job.company} - {app.created_at.strftime('%b %d')}",
-                    font=ctk.CTkFont(size=14),
-                    anchor="w",
-                )
-                activity_item.pack(anchor="w", padx=16, pady=5)
-        else:
-            no_activity = ctk.CTkLabel(
-                activity_frame, text="No recent activity", font=ctk.CTkFont(size=14), text_color=("gray30", "gray70")
+    if recent:
+        for activity in recent:
+            activity_item = ctk.CTkLabel(
+                activity_frame,
+                text=(
+                    f"\u2022 {activity['status'].title()}: {activity['title']} at {activity['company']}"
+                    f" - {activity['created_at'].strftime('%b %d')}"
+                ),
+                font=get_font(14),
+                anchor="w",
             )
-            no_activity.pack(pady=12)
-
-    finally:
-        session.close()
+            activity_item.pack(anchor="w", padx=16, pady=5)
+    else:
+        no_activity = ctk.CTkLabel(
+            activity_frame, text="No recent activity", font=get_font(14), text_color=("gray30", "gray70")
+        )
+        no_activity.pack(pady=12)
 
 
 # ============================================================================
@@ -1470,128 +1695,108 @@ def show_dashboard_view(window: ctk.CTk) -> None:
 # ============================================================================
 
 
-def get_user_statistics() -> Dict[str, int]:
-    """Get user statistics from database."""
-    session = orm.get_session()
-    try:
-        saved_jobs = session.query(orm.Job).filter_by(is_active=True).count()
-        applications = session.query(orm.JobApplication).count()
-        interviews = session.query(orm.JobApplication).filter_by(status="interview").count()
-        offers = session.query(orm.JobApplication).filter_by(status="accepted").count()
-
-        return {"saved_jobs": saved_jobs, "applications": applications, "interviews": interviews, "offers": offers}
-    finally:
-        session.close()
+def job_to_db_dict(job) -> Dict[str, Any]:
+    """Map a search result to the column values orm.save_job expects."""
+    return {
+        "external_id": job.Jobid,
+        "title": job.jobTitle,
+        "company": job.companyName,
+        "location": job.location,
+        "experience_required": job.experience,
+        "description": job.jobContext or "",
+        "posted_date": job.publishDate,
+        "deadline": job.deadlineDB,
+        "url": job.job_url,
+        "source": "bdjobs",
+    }
 
 
 def save_job_to_db(window: ctk.CTk, job) -> None:
-    """Save a job to the database."""
-    try:
-        # Parse deadline
-        deadline = None
-        if job.deadlineDB:
-            try:
-                deadline = job.deadlineDB
-            except:
-                pass
-
-        # Parse posted date
-        posted_date = None
-        if job.publishDate:
-            try:
-                posted_date = job.publishDate
-            except:
-                pass
-
-        job_data = {
-            "external_id": job.Jobid,
-            "title": job.jobTitle,
-            "company": job.companyName,
-            "location": job.location,
-            "experience_required": job.experience,
-            "description": job.jobContext or "",
-            "posted_date": posted_date,
-            "deadline": deadline,
-            "url": job.get_job_url(),
-            "source": "bdjobs",
-        }
-
-        job_id = orm.save_job(job_data)
+    """Save a job to the database (on the DB worker thread)."""
+    job_data = job_to_db_dict(job)
+
+    def on_saved(job_id: int) -> None:
         show_message(window, "Success", f"Job saved: {job.jobTitle}")
         logger.info(f"Saved job {job_id}: {job.jobTitle}")
 
-    except Exception as e:
+    def on_failed(e: Exception) -> None:
         show_message(window, "Error", f"Failed to save job: {str(e)}")
-        logger.error(f"Error saving job: {e}", exc_info=True)
+        logger.error(f"Error saving job: {e}", exc_info=e)
+
+    run_db_task(window, partial(orm.save_job, job_data), on_saved, on_failed)
 
 
 def mark_job_applied(window: ctk.CTk, job) -> None:
-    """Mark a job as applied and save to database."""
-    try:
-        # First save the job
-        deadline = None
-        if job.deadlineDB:
-            try:
-                deadline = job.deadlineDB
-            except:
-                pass
-
-        posted_date = None
-        if job.publishDate:
-            try:
-                posted_date = job.publishDate
-            except:
-                pass
-
-        job_data = {
-            "external_id": job.Jobid,
-            "title": job.jobTitle,
-            "company": job.companyName,
-            "location": job.location,
-            "experience_required": job.experience,
-            "description": job.jobContext or "",
-            "posted_date": posted_date,
-            "deadline": deadline,
-            "url": job.get_job_url(),
-            "source": "bdjobs",
-        }
-
-        job_id = orm.save_job(job_data)
-
-        # Get or create default profile
-        profiles = orm.get_all_profiles()
-        if not profiles:
-            profile_id = orm.create_profile({"name": "Default User", "email": "user@example.com"})
-        else:
-            profile_id = profiles[0]["id"]
+    """Mark a job as applied and save to database (on the DB worker thread)."""
+    job_data = job_to_db_dict(job)
 
-        # Create application
-        orm.create_application(profile_id, job_id, status="applied", notes="")
+    def apply() -> int:
+        # Save the job and file the application under the default profile, in one transaction
+        profile_id = orm.get_or_create_default_profile()
+        return orm.save_and_apply(job_data, profile_id, status="applied")
 
+    def on_applied(job_id: int) -> None:
         show_message(window, "Success", f"Marked as applied: {job.jobTitle}")
         logger.info(f"Marked job {job_id} as applied")
 
-    except Exception as e:
+    def on_failed(e: Exception) -> None:
         show_message(window, "Error", f"Failed to mark as applied: {str(e)}")
-        logger.error(f"Error marking job as applied: {e}", exc_info=True)
+        logger.error(f"Error marking job as applied: {e}", exc_info=e)
 
+    run_db_task(window, apply, on_applied, on_failed)
 
-def remove_saved_job(window: ctk.CTk, job_id: int) -> None:
-    """Remove a saved job from database."""
-    try:
-        session = orm.get_session()
+
+def run_db_task(
+    window: ctk.CTk, task: Callable[[], Any], on_success: Callable[[Any], None], on_error: Callable[[Exception], None]
+) -> None:
+    """
+    Run a database write on the DB worker thread and report the outcome on the main thread.
+
+    on_success receives the task's return value, on_error the exception it raised.
+    """
+
+    def report(future: Future) -> None:
         try:
-            job = session.query(orm.Job).filter_by(id=job_id).first()
-            if job:
-                job.is_active = False
-                session.commit()
-                show_message(window, "Success", "Job removed from saved jobs")
-                show_saved_jobs_view(window)  # Refresh view
-        finally:
-            session.close()
-    except Exception as e:
+            result = future.result()
+        except Exception as e:
+            window.after(0, on_error, e)
+        else:
+            window.after(0, on_success, result)
+
+    _db_executor.submit(task).add_done_callback(report)
+
+
+def remove_saved_job(window: ctk.CTk, job_id: int, card: ctk.CTkFrame) -> None:
+    """Remove a saved job from database (on the DB worker thread) and its card from the saved jobs list."""
+
+    def remove() -> bool:
+        with orm.session_scope() as session:
+            job = session.get(orm.Job, job_id)
+            if not job:
+                return False
+            job.is_active = False
+        orm.invalidate_stats_cache()
+        return True
+
+    def on_removed(removed: bool) -> None:
+        if not removed:
+            return
+        show_message(window, "Success", "Job removed from saved jobs")
+        if not card.winfo_exists():
+            return  # the user has already left the view
+
+        # Drop just this card; only an emptied list needs the view rebuilt (for its placeholder).
+        # Cards are frames, so the "Load more" button does not count as a remaining job.
+        saved_list = card.master
+        card.destroy()
+        if not any(isinstance(child, ctk.CTkFrame) for child in saved_list.winfo_children()):
+            show_saved_jobs_view(window)
+
+    def on_failed(e: Exception) -> None:
         show_message(window, "Error", f"Failed to remove job: {str(e)}")
-        logger.error(f"Error removing job: {e}", exc_info=True)
+        logger.error(f"Error removing job: {e}", exc_info=e)
+
+    run_db_task(window, remove, on_removed, on_failed)
 
 
 def update_application_status_ui(window: ctk.CTk, app_id: int, new_status: str, status_label: ctk.CTkLabel) -> None:
@@ -1601,14 +1806,7 @@ def update_application_status_ui(window: ctk.CTk, app_id: int, new_status: str,
         logger.info(f"Updated application {app_id} status to {new_status}")
         
         # Update just the status label color and text
-        status_colors = {
-            "interested": "orange",
-            "applied": "blue",
-            "interview": "purple",
-            "rejected": "red",
-            "accepted": "green",
-        }
-        status_color = status_colors.get(new_status, "gray")
+        status_color = STATUS_COLORS.get(new_status, "gray")
         status_label.configure(text=f"● {new_status.title()}", text_color=status_color)
         
     except Exception as e:
@@ -1616,49 +1814,84 @@ def update_application_status_ui(window: ctk.CTk, app_id: int, new_status: str,
         logger.error(f"Error updating status: {e}", exc_info=True)
 
 
+def center_on_window(dialog: ctk.CTkToplevel, window: ctk.CTk, width: int, height: int) -> None:
+    """
+    Size a dialog and place it over the centre of the main window.
+
+    The dialog size is known up front, so no update_idletasks() round is needed
+    to measure it (which would also run every other pending idle callback).
+    """
+    scaling = ctk.ScalingTracker.get_window_scaling(window)
+    x = window.winfo_x() + (window.winfo_width() - round(width * scaling)) // 2
+    y = window.winfo_y() + (window.winfo_height() - round(height * scaling)) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+
 def show_message(window: ctk.CTk, title: str, message: str) -> None:
     """Show a message dialog."""
     dialog = ctk.CTkToplevel(window)
     dialog.title(title)
-    dialog.geometry("400x200")
     dialog.transient(window)
     dialog.grab_set()
 
     # Center dialog
-    dialog.update_idletasks()
-    x = window.winfo_x() + (window.winfo_width() - dialog.winfo_width()) // 2
-    y = window.winfo_y() + (window.winfo_height() - dialog.winfo_height()) // 2
-    dialog.geometry(f"+{x}+{y}")
+    center_on_window(dialog, window, 400, 200)
 
-    msg_label = ctk.CTkLabel(dialog, text=message, font=ctk.CTkFont(size=14), wraplength=350)
+    msg_label = ctk.CTkLabel(dialog, text=message, font=get_font(14), wraplength=350)
     msg_label.pack(pady=20, padx=16)
 
     ok_button = ctk.CTkButton(dialog, text="OK", command=dialog.destroy, width=100)
     ok_button.pack(pady=12)
 
 
-def show_loading(window: ctk.CTk, message: str) -> ctk.CTkToplevel:
-    """Show a loading dialog."""
+def show_loading(window: ctk.CTk, message: str) -> None:
+    """
+    Show the loading dialog with the given message.
+
+    The dialog is built on first use and afterwards only hidden and shown
+    again, so later searches skip creating a new toplevel window.
+    """
+    overlay = window.app_state["loading_overlay"]
+    if overlay is None or not overlay["dialog"].winfo_exists():
+        overlay = build_loading_overlay(window)
+        window.app_state["loading_overlay"] = overlay
+
+    dialog = overlay["dialog"]
+    overlay["message"].set(message)
+    # Center loading dialog (the main window may have moved since last time)
+    center_on_window(dialog, window, 350, 150)
+    dialog.deiconify()
+    dialog.grab_set()
+    overlay["progress"].start()
+
+
+def build_loading_overlay(window: ctk.CTk) -> Dict[str, Any]:
+    """Build the (hidden) loading dialog and return its dialog, message variable and progress bar."""
     loading = ctk.CTkToplevel(window)
+    loading.withdraw()
     loading.title("Please Wait")
-    loading.geometry("350x150")
     loading.transient(window)
-    loading.grab_set()
-
-    # Center loading dialog
-    loading.update_idletasks()
-    x = window.winfo_x() + (window.winfo_width() - loading.winfo_width()) // 2
-    y = window.winfo_y() + (window.winfo_height() - loading.winfo_height()) // 2
-    loading.geometry(f"+{x}+{y}")
 
-    msg_label = ctk.CTkLabel(loading, text=message, font=ctk.CTkFont(size=14))
+    message_var = ctk.StringVar(value="")
+    msg_label = ctk.CTkLabel(loading, textvariable=message_var, font=get_font(14))
     msg_label.pack(pady=20)
 
     progress = ctk.CTkProgressBar(loading, mode="indeterminate", width=300)
     progress.pack(pady=12)
-    progress.start()
 
-    return loading
+    return {"dialog": loading, "message": message_var, "progress": progress}
+
+
+def hide_loading(window: ctk.CTk) -> None:
+    """Hide the loading dialog, keeping it for the next use."""
+    overlay = window.app_state["loading_overlay"]
+    if overlay is None or not overlay["dialog"].winfo_exists():
+        # Never shown, or closed by the user
+        return
+
+    overlay["progress"].stop()
+    overlay["dialog"].grab_release()
+    overlay["dialog"].withdraw()
 
 
 # ============================================================================
@@ -1675,6 +1908,8 @@ def run_application() -> None:
         logger.error(f"Application error: {e}", exc_info=True)
         raise
     finally:
+        # Let queued writes finish before the database is closed
+        _db_executor.shutdown(wait=True)
         scraper.close_http_client()
         orm.close_database()
 
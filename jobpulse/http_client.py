@@ -4,9 +4,13 @@ HTTP client utilities for making API requests.
 Provides connection pooling, rate limiting, retry logic, and error handling.
 """
 
+import atexit
+import importlib.util
 import logging
+import threading
 import time
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 import httpx
@@ -19,6 +23,9 @@ from tenacity import (
 
 from .config import (
     DEFAULT_TIMEOUT,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_ENABLED,
+    KEEPALIVE_EXPIRY,
     MAX_CONNECTIONS,
     MAX_KEEPALIVE_CONNECTIONS,
     MAX_RETRIES,
@@ -28,11 +35,33 @@ from .config import (
     USER_AGENT,
 )
 
+try:
+    # Optional: orjson parses the large search payloads several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional: hishel 1.x keeps an on-disk HTTP cache so repeat GETs across runs skip the network.
+    # Older hishel releases lack these names and are treated as not installed.
+    from hishel import CacheOptions, SpecificationPolicy, SyncSqliteStorage
+    from hishel.httpx import SyncCacheTransport
+except ImportError:
+    SyncCacheTransport = None
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 (one multiplexed connection for all API calls) needs httpx's optional h2 package,
+# installed with `pip install "httpx[http2]"`. Without it the client stays on HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Responses are cached on disk only when enabled in config and hishel 1.x is installed.
+HTTP_CACHE_ACTIVE = HTTP_CACHE_ENABLED and SyncCacheTransport is not None
+
 # Module-level state
 _client: Optional[httpx.Client] = None
-_last_request_time: float = 0.0
+_rate_limit_lock = threading.Lock()
+_next_request_time: float = 0.0  # time.monotonic() value before which no request may start
 
 
 def get_http_client() -> httpx.Client:
@@ -45,16 +74,34 @@ def get_http_client() -> httpx.Client:
     global _client
 
     if _client is None or _client.is_closed:
-        _client = httpx.Client(
-            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
-            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
-            follow_redirects=True,
-            headers={
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        client_kwargs = {
+            "timeout": httpx.Timeout(DEFAULT_TIMEOUT),
+            "follow_redirects": True,
+            "headers": {
                 "User-Agent": USER_AGENT,
                 "Accept": "application/json",
             },
-        )
-        logger.debug("HTTP client created")
+        }
+
+        if HTTP_CACHE_ACTIVE:
+            # Cache hits never reach the inner transport, so only real network calls are rate limited.
+            # Responses are reused only while fresh by their Cache-Control/ETag headers, never stale.
+            cache_dir = Path(HTTP_CACHE_DIR)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            transport = SyncCacheTransport(
+                next_transport=RateLimitedTransport(limits=limits, http2=HTTP2_AVAILABLE),
+                storage=SyncSqliteStorage(database_path=cache_dir / "hishel_cache.db"),
+                policy=SpecificationPolicy(cache_options=CacheOptions(supported_methods=["GET"])),
+            )
+            _client = httpx.Client(transport=transport, **client_kwargs)
+        else:
+            _client = httpx.Client(limits=limits, http2=HTTP2_AVAILABLE, **client_kwargs)
+        logger.debug(f"HTTP client created (HTTP/2: {HTTP2_AVAILABLE}, cache: {HTTP_CACHE_ACTIVE})")
 
     return _client
 
@@ -69,6 +116,10 @@ def close_http_client() -> None:
         logger.info("HTTP client closed")
 
 
+# The shared client lives for the whole process; close its connections on interpreter exit if nobody did
+atexit.register(close_http_client)
+
+
 @contextmanager
 def http_client_context():
     """
@@ -91,18 +142,28 @@ def rate_limit() -> None:
     """
     Implement simple rate limiting to avoid overwhelming the API.
 
-    Enforces a minimum interval between requests.
+    Enforces a minimum interval between requests. Safe to call from several
+    threads: each caller reserves the next free slot under a lock, then sleeps
+    until that slot outside the lock.
     """
-    global _last_request_time
+    global _next_request_time
 
-    current_time = time.time()
-    time_since_last_request = current_time - _last_request_time
+    with _rate_limit_lock:
+        current_time = time.monotonic()
+        request_time = max(current_time, _next_request_time)
+        _next_request_time = request_time + MIN_REQUEST_INTERVAL
 
-    if time_since_last_request < MIN_REQUEST_INTERVAL:
-        sleep_time = MIN_REQUEST_INTERVAL - time_since_last_request
+    sleep_time = request_time - current_time
+    if sleep_time > 0:
         time.sleep(sleep_time)
 
-    _last_request_time = time.time()
+
+class RateLimitedTransport(httpx.HTTPTransport):
+    """HTTP transport that applies rate_limit() before each request sent over the network."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        rate_limit()
+        return super().handle_request(request)
 
 
 @retry(
@@ -111,7 +172,7 @@ def rate_limit() -> None:
     wait=wait_exponential(multiplier=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
     reraise=True,
 )
-def api_get(url: str) -> Dict[str, Any]:
+def api_get(url: str, client: Optional[httpx.Client] = None) -> Dict[str, Any]:
     """
     Make a GET request to the API with retry logic.
 
@@ -119,7 +180,7 @@ def api_get(url: str) -> Dict[str, Any]:
 
     Args:
         url: The API endpoint URL
-        params: Optional query parameters
+        client: HTTP client to use (default: the shared pooled client)
 
     Returns:
         Parsed JSON response as dictionary
@@ -129,29 +190,32 @@ def api_get(url: str) -> Dict[str, Any]:
         ValueError: For invalid JSON responses
         RuntimeError: For API-specific errors
     """
-    rate_limit()
+    if client is None:
+        client = get_http_client()
 
-    client = get_http_client()
+    # The shared caching client throttles inside its transport, so cache hits are not delayed
+    if not (HTTP_CACHE_ACTIVE and client is _client):
+        rate_limit()
 
     try:
         logger.debug(f"Making API request to: {url}")
         response = client.get(url)
         response.raise_for_status()
+        if response.extensions.get("hishel_from_cache"):
+            logger.debug("Served from HTTP cache")
 
         # Validate JSON response
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except ValueError as e:
             logger.error(f"Invalid JSON response: {e}")
             raise ValueError(f"API returned invalid JSON: {e}")
 
-        # Check API-level status
-        if isinstance(data, dict):
-            status_code = data.get("statuscode")
-            if status_code and status_code != "1":
-                error_msg = data.get("message", "Unknown API error")
-                logger.error(f"API error: {error_msg} (status: {status_code})")
-                raise RuntimeError(f"API error: {error_msg}")
+        # Check API-level status; successful responses carry statuscode "1"
+        if type(data) is dict and data.get("statuscode", "1") != "1":
+            error_msg = data.get("message", "Unknown API error")
+            logger.error(f"API error: {error_msg} (status: {data['statuscode']})")
+            raise RuntimeError(f"API error: {error_msg}")
 
         logger.debug("API request successful")
         return data
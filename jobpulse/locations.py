@@ -4,12 +4,12 @@ Location and city utilities for BDJobs API.
 Provides mapping between city names and IDs for location-based filtering.
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 # Bangladesh cities and their API IDs
-from typing import Dict, List
-
-CITY_ID_MAP: List[Dict[str, str]] = [
+_CITY_ROWS: List[Dict[str, str]] = [
     {"id": "1003", "name": "Dhaka Division"},
     {"id": "14", "name": "Dhaka"},
     {"id": "16", "name": "Faridpur"},
@@ -91,7 +91,19 @@ CITY_ID_MAP: List[Dict[str, str]] = [
     {"id": "62", "name": "Sylhet"},
 ]
 
+# Read-only view of the cities, safe to hand out without copying
+CITY_ID_MAP: Tuple[Mapping[str, str], ...] = tuple(MappingProxyType(city) for city in _CITY_ROWS)
+
+# City names in CITY_ID_MAP order, for option lists
+CITY_NAMES: Tuple[str, ...] = tuple(city["name"] for city in CITY_ID_MAP)
+
+# Lookup indexes over CITY_ID_MAP, built once at import
+_CITY_BY_NAME_LOWER: Dict[str, str] = {city["name"].lower(): city["id"] for city in CITY_ID_MAP}
+_CITY_BY_ID: Dict[str, str] = {city["id"]: city["name"] for city in CITY_ID_MAP}
+_CITY_NAMES_LOWER: Tuple[str, ...] = tuple(name.lower() for name in CITY_NAMES)
+
 
+@lru_cache(maxsize=256)
 def get_city_id(city_name: str) -> Optional[str]:
     """
     Get city ID by name for location filtering.
@@ -111,15 +123,10 @@ def get_city_id(city_name: str) -> Optional[str]:
     if not city_name:
         return None
 
-    city_name_lower = city_name.lower().strip()
-
-    for city in CITY_ID_MAP:
-        if city["name"].lower() == city_name_lower:
-            return city["id"]
-
-    return None
+    return _CITY_BY_NAME_LOWER.get(city_name.lower().strip())
 
 
+@lru_cache(maxsize=256)
 def get_city_name(city_id: str) -> Optional[str]:
     """
     Get city name by ID.
@@ -139,29 +146,25 @@ def get_city_name(city_id: str) -> Optional[str]:
     if not city_id:
         return None
 
-    for city in CITY_ID_MAP:
-        if city["id"] == city_id:
-            return city["name"]
-
-    return None
+    return _CITY_BY_ID.get(city_id)
 
 
-def get_all_cities() -> List[Dict[str, str]]:
+def get_all_cities() -> Sequence[Mapping[str, str]]:
     """
     Get all available cities.
 
     Returns:
-        List of dictionaries with 'id' and 'name' keys
+        Read-only sequence of mappings with 'id' and 'name' keys
 
     Example:
         >>> cities = get_all_cities()
         >>> len(cities) > 0
         True
     """
-    return CITY_ID_MAP.copy()
+    return CITY_ID_MAP
 
 
-def search_cities(query: str) -> List[Dict[str, str]]:
+def search_cities(query: str) -> List[Mapping[str, str]]:
     """
     Search for cities by partial name match.
 
@@ -181,4 +184,4 @@ def search_cities(query: str) -> List[Dict[str, str]]:
 
     query_lower = query.lower().strip()
 
-    return [city for city in CITY_ID_MAP if query_lower in city["name"].lower()]
+    return [city for city, name in zip(CITY_ID_MAP, _CITY_NAMES_LOWER) if query_lower in name]
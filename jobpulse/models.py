@@ -5,9 +5,10 @@ Provides type-safe data structures for job listings and search results.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .config import BASE_URL
 
@@ -38,15 +39,17 @@ class SearchResult(BaseModel):
     isEarlyAccess: bool = Field(default=False, description="Early access job flag")
     OnlineJob: bool = Field(default=False, description="Online/remote job flag")
 
-    class Config:
-        """Pydantic model configuration."""
+    # Results are read-only once parsed: validated once on construction, never on assignment
+    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True, frozen=True)
 
-        populate_by_name = True
-        str_strip_whitespace = True
+    @cached_property
+    def job_url(self) -> str:
+        """Job detail URL, built on first access (Jobid never changes on a frozen result)."""
+        return f"{BASE_URL}/jobs/details/{self.Jobid}"
 
     def get_job_url(self) -> str:
         """Generate the job detail URL."""
-        return f"{BASE_URL}/jobs/details/{self.Jobid}"
+        return self.job_url
 
     def is_remote(self) -> bool:
         """Check if this is a remote/online job."""
@@ -4,9 +4,14 @@ Handles database connections and data models for app config, user profiles, and
 """
 
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import (
     Boolean,
@@ -14,12 +19,24 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    case,
+    column,
     create_engine,
+    event,
+    func,
+    insert,
+    select,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import declarative_base, joinedload, relationship, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +46,62 @@ Base = declarative_base()
 _engine = None
 _SessionLocal = None
 
+# Page size for newly created SQLite databases; larger pages mean shallower b-trees for the jobs tables
+SQLITE_PAGE_SIZE = 8192
+
+# SQLite tuning applied to every new connection (journal_mode=WAL is added for file databases)
+SQLITE_PRAGMAS = (
+    "synchronous=NORMAL",
+    "cache_size=-64000",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "wal_autocheckpoint=1000",
+)
+
+# Connection pool for file databases, and how long a connection waits on another's write lock
+SQLITE_POOL_SIZE = 4
+SQLITE_BUSY_TIMEOUT = 30.0  # seconds
+
+# Keep the external-content jobs_fts index in step with the jobs table
+JOB_SEARCH_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+)
+_job_search_fts = False  # set by init_database once jobs_fts is ready
+
+# Rows per multi-row INSERT in save_jobs_bulk and create_applications_bulk
+JOB_UPSERT_BATCH_SIZE = 50
+APPLICATION_INSERT_BATCH_SIZE = 40
+
+# Dashboard statistics and recent activity are reused for this long, unless a write invalidates them first
+STATS_CACHE_TTL = 60.0  # seconds
+_stats_cache: Dict[Any, Tuple[float, Any]] = {}
+_stats_cache_generation = 0
+
+# get_job results by job ID, reused for this long unless the job is saved again (oldest evicted past the max size)
+JOB_CACHE_TTL = 300.0  # seconds
+JOB_CACHE_MAX_SIZE = 1024
+_job_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+_job_cache_lock = threading.Lock()
+
+# Opt-in SQL statement counting for spotting N+1 regressions: set JOBPULSE_SQL_COUNT=1 before start-up
+SQL_COUNT_ENABLED = bool(os.environ.get("JOBPULSE_SQL_COUNT"))
+_sql_counts = threading.local()  # per-thread statement count, so concurrent workers don't skew a check
+
+# Snapshot of every config key/value pair, built by get_all_configs and dropped on any config write
+_all_configs_cache: Optional[Dict[str, str]] = None
+
+# Profile that applications are filed under when none is chosen, found once then reused
+_default_profile_id: Optional[int] = None
+
 
 # ============================================================================
 # Database Models
@@ -69,6 +142,20 @@ class UserProfile(Base):
 
     # Relationships
     job_applications = relationship("JobApplication", back_populates="profile")
+    keyword_rows = relationship("ProfileKeyword", back_populates="profile", cascade="all, delete-orphan")
+
+
+class ProfileKeyword(Base):
+    """One keyword of a user profile; the indexed form of UserProfile.keywords."""
+
+    __tablename__ = "profile_keywords"
+
+    id = Column(Integer, primary_key=True)
+    profile_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=False, index=True)
+    keyword = Column(String(64), nullable=False, index=True)  # Stripped and lowercased
+
+    # Relationships
+    profile = relationship("UserProfile", back_populates="keyword_rows")
 
 
 class Job(Base):
@@ -98,6 +185,13 @@ class Job(Base):
     # Relationships
     applications = relationship("JobApplication", back_populates="job")
 
+    __table_args__ = (
+        # Saved-jobs count filters on is_active (the leading column); search also orders by posted_date
+        Index("ix_jobs_active_posted", "is_active", "posted_date"),
+        Index("ix_jobs_location", "location"),
+        Index("ix_jobs_job_type", "job_type"),
+    )
+
 
 class JobApplication(Base):
     """Track job applications and their status."""
@@ -117,6 +211,14 @@ class JobApplication(Base):
     profile = relationship("UserProfile", back_populates="job_applications")
     job = relationship("Job", back_populates="applications")
 
+    __table_args__ = (
+        # Interview/offer counts filter on status; application lists sort newest first
+        Index("ix_jobapp_status", "status"),
+        Index("ix_jobapp_created_at", created_at.desc()),
+        # Per-profile application lists, newest first
+        Index("ix_apps_profile_created", "profile_id", "created_at"),
+    )
+
 
 # ============================================================================
 # Database Connection Management
@@ -131,7 +233,7 @@ def init_database(connection_string: Optional[str] = None) -> None:
         connection_string: SQLAlchemy connection string.
                           Defaults to SQLite in user's home directory.
     """
-    global _engine, _SessionLocal
+    global _engine, _SessionLocal, _default_profile_id, _job_search_fts
 
     if connection_string is None:
         # db_path = Path.home() / ".jobpulse" / "jobpulse.db"
@@ -140,14 +242,146 @@ def init_database(connection_string: Optional[str] = None) -> None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         connection_string = f"sqlite:///{db_path}"
 
-    _engine = create_engine(connection_string, echo=False)
-    _SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False)
+    engine_options: Dict[str, Any] = {}
+    if connection_string.startswith("sqlite") and not _is_sqlite_memory_url(connection_string):
+        # A small fixed pool shared by the UI thread and the database worker; SQLite allows one writer anyway
+        engine_options = {
+            "poolclass": QueuePool,
+            "pool_size": SQLITE_POOL_SIZE,
+            "max_overflow": 0,
+            "pool_recycle": 3600,
+            "connect_args": {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT},
+        }
+    _engine = create_engine(connection_string, echo=False, **engine_options)
+
+    if _engine.dialect.name == "sqlite":
+        pragmas = list(SQLITE_PRAGMAS)
+        if not _is_sqlite_memory_url(connection_string):
+            # WAL lets readers proceed while a write is in progress
+            pragmas.insert(0, "journal_mode=WAL")
+        # Only takes effect on a new, still empty database, so it must run before journal_mode writes the header
+        pragmas.insert(0, f"page_size={SQLITE_PAGE_SIZE}")
+        event.listen(_engine, "connect", lambda dbapi_conn, _: _apply_sqlite_pragmas(dbapi_conn, pragmas))
+
+    # Objects stay readable after commit, so callers can return their ids without reloading them
+    _SessionLocal = sessionmaker(bind=_engine, autocommit=False, autoflush=False, expire_on_commit=False)
+
+    clear_config_cache()
+    forget_cached_jobs()
+    invalidate_stats_cache()
+    _default_profile_id = None
+    _job_search_fts = False
 
     # Create all tables
     Base.metadata.create_all(bind=_engine)
+
+    # create_all only emits indexes together with new tables; add any missing from existing databases
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=_engine, checkfirst=True)
+
+    if SQL_COUNT_ENABLED:
+        event.listen(_engine, "before_cursor_execute", _count_sql_statement)
+
+    if _engine.dialect.name == "sqlite":
+        _create_job_search_index()
+    _backfill_profile_keywords()
     logger.info(f"Database initialized: {connection_string}")
 
 
+def _create_job_search_index() -> None:
+    """
+    Create the jobs_fts full-text index over jobs(title, description), kept in sync by triggers.
+
+    Uses FTS5's trigram tokenizer, so a MATCH finds the same substrings the old LIKE '%keyword%' did.
+    Leaves keyword search on LIKE if this SQLite build lacks FTS5 or trigram support.
+    """
+    global _job_search_fts
+
+    try:
+        with _engine.begin() as conn:
+            created = conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").first() is None
+            conn.exec_driver_sql(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+                "title, description, content='jobs', content_rowid='id', tokenize='trigram')"
+            )
+            for trigger in JOB_SEARCH_TRIGGERS:
+                conn.exec_driver_sql(trigger)
+            if created:
+                # Index the jobs saved before the table existed
+                conn.exec_driver_sql("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+    except DBAPIError as e:
+        logger.warning(f"Full-text job search unavailable, using LIKE: {e}")
+        _job_search_fts = False
+    else:
+        _job_search_fts = True
+
+
+def _count_sql_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Engine listener (JOBPULSE_SQL_COUNT only): count and log each statement sent to the database."""
+    _sql_counts.value = _sql_statement_count() + 1
+    logger.debug(f"SQL: {statement}")
+
+
+def _sql_statement_count() -> int:
+    """Number of SQL statements the current thread has run since counting started."""
+    return getattr(_sql_counts, "value", 0)
+
+
+@contextmanager
+def assert_max_queries(limit: int, label: str = "block"):
+    """
+    Raise AssertionError if the block runs more than limit SQL statements (JOBPULSE_SQL_COUNT only).
+
+    Does nothing when counting is off, so it can stay wrapped around code paths in normal runs.
+    Only statements run by the current thread count, so other threads' queries cannot trip it.
+
+    Example:
+        with assert_max_queries(2, "dashboard"):
+            stats = get_user_statistics()
+    """
+    if not SQL_COUNT_ENABLED:
+        yield
+        return
+
+    start = _sql_statement_count()
+    yield
+    count = _sql_statement_count() - start
+    logger.debug(f"{label}: {count} SQL statement(s)")
+    if count > limit:
+        raise AssertionError(f"{label} ran {count} SQL statements, expected at most {limit}")
+
+
+def _is_sqlite_memory_url(connection_string: str) -> bool:
+    """Whether a SQLite connection string names an in-memory database (kept on its default pool)."""
+    return make_url(connection_string).database in (None, "", ":memory:")
+
+
+def _is_sqlite(session) -> bool:
+    """Whether the session's database is SQLite, so SQLite-only SQL such as ON CONFLICT upserts can be used."""
+    return session.get_bind().dialect.name == "sqlite"
+
+
+def _backfill_profile_keywords() -> None:
+    """Fill profile_keywords for profiles whose keywords were saved before the table existed."""
+    with session_scope() as session:
+        profiles = session.scalars(
+            select(UserProfile).where(UserProfile.keywords.is_not(None), ~UserProfile.keyword_rows.any())
+        ).all()
+        for profile in profiles:
+            _set_profile_keywords(profile, profile.keywords)
+
+
+def _apply_sqlite_pragmas(dbapi_conn, pragmas: List[str]) -> None:
+    """Execute the given PRAGMA statements on a raw SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
 def get_session():
     """Get a new database session."""
     if _SessionLocal is None:
@@ -155,11 +389,43 @@ def get_session():
     return _SessionLocal()
 
 
+@contextmanager
+def session_scope():
+    """
+    Provide a transactional scope around a series of operations.
+
+    Commits when the block exits normally, rolls back if it raises, and always closes the session.
+
+    Example:
+        with session_scope() as session:
+            session.add(obj)
+    """
+    session = get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def close_database() -> None:
     """Close database connection."""
-    global _engine
+    global _engine, _default_profile_id
     if _engine:
+        if _engine.dialect.name == "sqlite":
+            # Refresh query planner statistics so the next start-up gets good plans
+            try:
+                with _engine.connect() as conn:
+                    conn.exec_driver_sql("PRAGMA optimize")
+            except Exception as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
         _engine.dispose()
+        clear_config_cache()
+        invalidate_stats_cache()
+        _default_profile_id = None
         logger.info("Database connection closed")
 
 
@@ -169,41 +435,56 @@ def close_database() -> None:
 
 
 def get_config(key: str, default: Any = None) -> Any:
-    """Get configuration value by key."""
-    session = get_session()
-    try:
-        config = session.query(AppConfig).filter_by(key=key).first()
-        return config.value if config else default
-    finally:
-        session.close()
+    """Get configuration value by key (cached until the next config write)."""
+    value = _get_config_cached(key)
+    return default if value is None else value
+
+
+@lru_cache(maxsize=256)
+def _get_config_cached(key: str) -> Optional[str]:
+    """Read a config value from the database; None if the key is not set."""
+    with session_scope() as session:
+        return session.scalar(select(AppConfig.value).where(AppConfig.key == key))
+
+
+def clear_config_cache() -> None:
+    """Drop cached config values so the next reads go to the database."""
+    global _all_configs_cache
+    _get_config_cached.cache_clear()
+    _all_configs_cache = None
 
 
 def set_config(key: str, value: Any, description: str = "") -> None:
-    """Set configuration value."""
-    session = get_session()
-    try:
-        config = session.query(AppConfig).filter_by(key=key).first()
-        if config:
-            config.value = str(value)
-            config.updated_at = datetime.utcnow()
+    """Set configuration value; an existing description is kept unless a new one is given."""
+    with session_scope() as session:
+        if _is_sqlite(session):
+            # One INSERT ... ON CONFLICT(key) DO UPDATE instead of a SELECT then an UPDATE or INSERT
+            stmt = sqlite_insert(AppConfig).values(key=key, value=str(value), description=description)
+            updates = {"value": stmt.excluded.value, "updated_at": datetime.utcnow()}
             if description:
-                config.description = description
+                updates["description"] = stmt.excluded.description
+            session.execute(stmt.on_conflict_do_update(index_elements=[AppConfig.key], set_=updates))
         else:
-            config = AppConfig(key=key, value=str(value), description=description)
-            session.add(config)
-        session.commit()
-    finally:
-        session.close()
+            config = session.scalar(select(AppConfig).where(AppConfig.key == key))
+            if config:
+                config.value = str(value)
+                config.updated_at = datetime.utcnow()
+                if description:
+                    config.description = description
+            else:
+                session.add(AppConfig(key=key, value=str(value), description=description))
+
+    clear_config_cache()
 
 
 def get_all_configs() -> Dict[str, str]:
-    """Get all configuration key-value pairs."""
-    session = get_session()
-    try:
-        configs = session.query(AppConfig).all()
-        return {config.key: config.value for config in configs}
-    finally:
-        session.close()
+    """Get all configuration key-value pairs (cached until the next config write)."""
+    global _all_configs_cache
+    if _all_configs_cache is None:
+        with session_scope() as session:
+            configs = session.query(AppConfig).all()
+            _all_configs_cache = {config.key: config.value for config in configs}
+    return dict(_all_configs_cache)
 
 
 # ============================================================================
@@ -213,89 +494,97 @@ def get_all_configs() -> Dict[str, str]:
 
 def create_profile(profile_data: Dict[str, Any]) -> int:
     """Create a new user profile."""
-    session = get_session()
-    try:
+    with session_scope() as session:
         profile = UserProfile(**profile_data)
+        _set_profile_keywords(profile, profile.keywords)
         session.add(profile)
-        session.commit()
-        session.refresh(profile)
+        session.flush()
         return profile.id
-    finally:
-        session.close()
 
 
 def get_profile(profile_id: int) -> Optional[Dict[str, Any]]:
     """Get user profile by ID."""
-    session = get_session()
-    try:
-        profile = session.query(UserProfile).filter_by(id=profile_id).first()
-        if profile:
-            return {
-                "id": profile.id,
-                "name": profile.name,
-                "email": profile.email,
-                "phone": profile.phone,
-                "location": profile.location,
-                "preferred_job_type": profile.preferred_job_type,
-                "preferred_job_level": profile.preferred_job_level,
-                "min_salary": profile.min_salary,
-                "max_salary": profile.max_salary,
-                "keywords": profile.keywords,
-                "is_active": profile.is_active,
-            }
-        return None
-    finally:
-        session.close()
+    query = select(
+        UserProfile.id,
+        UserProfile.name,
+        UserProfile.email,
+        UserProfile.phone,
+        UserProfile.location,
+        UserProfile.preferred_job_type,
+        UserProfile.preferred_job_level,
+        UserProfile.min_salary,
+        UserProfile.max_salary,
+        UserProfile.keywords,
+        UserProfile.is_active,
+    ).where(UserProfile.id == profile_id)
+    with session_scope() as session:
+        row = session.execute(query).mappings().first()
+        return dict(row) if row else None
 
 
 def get_all_profiles() -> List[Dict[str, Any]]:
     """Get all user profiles."""
-    session = get_session()
-    try:
-        profiles = session.query(UserProfile).filter_by(is_active=True).all()
-        return [
-            {
-                "id": p.id,
-                "name": p.name,
-                "email": p.email,
-                "location": p.location,
-            }
-            for p in profiles
-        ]
-    finally:
-        session.close()
+    query = select(UserProfile.id, UserProfile.name, UserProfile.email, UserProfile.location).where(
+        UserProfile.is_active.is_(True)
+    )
+    with session_scope() as session:
+        return [dict(row) for row in session.execute(query).mappings()]
+
+
+def get_or_create_default_profile() -> int:
+    """Get the ID of the first active profile, creating a default one if there is none."""
+    global _default_profile_id
+    if _default_profile_id is not None:
+        return _default_profile_id
+
+    with session_scope() as session:
+        profile_id = session.scalar(
+            select(UserProfile.id).where(UserProfile.is_active.is_(True)).order_by(UserProfile.id).limit(1)
+        )
+
+    if profile_id is None:
+        profile_id = create_profile({"name": "Default User", "email": "user@example.com"})
+
+    _default_profile_id = profile_id
+    return profile_id
 
 
 def update_profile(profile_id: int, profile_data: Dict[str, Any]) -> bool:
     """Update user profile."""
-    session = get_session()
-    try:
-        profile = session.query(UserProfile).filter_by(id=profile_id).first()
+    with session_scope() as session:
+        profile = session.get(UserProfile, profile_id)
         if profile:
             for key, value in profile_data.items():
                 if hasattr(profile, key):
                     setattr(profile, key, value)
+            if "keywords" in profile_data:
+                _set_profile_keywords(profile, profile.keywords)
             profile.updated_at = datetime.utcnow()
-            session.commit()
             return True
         return False
-    finally:
-        session.close()
+
+
+def _set_profile_keywords(profile: UserProfile, keywords: Optional[str]) -> None:
+    """Replace the profile's keyword rows with the distinct entries of a comma-separated keywords string."""
+    distinct = dict.fromkeys(keyword.strip().lower()[:64] for keyword in (keywords or "").split(","))
+    distinct.pop("", None)
+    profile.keyword_rows = [ProfileKeyword(keyword=keyword) for keyword in distinct]
 
 
 def delete_profile(profile_id: int) -> bool:
     """Soft delete user profile."""
-    session = get_session()
-    try:
-        profile = session.query(UserProfile).filter_by(id=profile_id).first()
+    global _default_profile_id
+    with session_scope() as session:
+        profile = session.get(UserProfile, profile_id)
         if profile:
             profile.is_active = False
             profile.updated_at = datetime.utcnow()
-            session.commit()
-            return True
-        return False
-    finally:
-        session.close()
+        else:
+            return False
+
+    if profile_id == _default_profile_id:
+        _default_profile_id = None
+    return True
 
 
 # ============================================================================
@@ -305,87 +594,145 @@ def delete_profile(profile_id: int) -> bool:
 
 def save_job(job_data: Dict[str, Any]) -> int:
     """Save or update a job listing."""
-    session = get_session()
-    try:
-        external_id = job_data.get("external_id")
-        job = None
-
-        if external_id:
-            job = session.query(Job).filter_by(external_id=external_id).first()
-
-        if job:
-            # Update existing job
-            for key, value in job_data.items():
-                if hasattr(job, key):
-                    setattr(job, key, value)
-            job.updated_at = datetime.utcnow()
+    with session_scope() as session:
+        job = _upsert_job(session, job_data)
+
+    forget_cached_jobs([job.id])
+    invalidate_stats_cache()
+    return job.id
+
+
+def save_jobs_bulk(job_dicts: List[Dict[str, Any]]) -> List[int]:
+    """
+    Save or update many job listings in one transaction; returns their IDs in input order.
+
+    On SQLite each batch of JOB_UPSERT_BATCH_SIZE jobs is a single INSERT ... ON CONFLICT(external_id) DO UPDATE,
+    which updates only the columns given (as save_job does). All dicts must have the same keys.
+    Other databases upsert job by job, as save_job does.
+    """
+    if not job_dicts:
+        return []
+
+    job_ids = []
+    with session_scope() as session:
+        if _is_sqlite(session):
+            stmt = sqlite_insert(Job)
+            update_columns = {key: stmt.excluded[key] for key in job_dicts[0] if key not in ("id", "created_at")}
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Job.external_id],
+                set_={**update_columns, "updated_at": datetime.utcnow()},
+            ).returning(Job.id, sort_by_parameter_order=True)
+            for start in range(0, len(job_dicts), JOB_UPSERT_BATCH_SIZE):
+                batch = job_dicts[start : start + JOB_UPSERT_BATCH_SIZE]
+                job_ids.extend(session.scalars(stmt, batch).all())
         else:
-            # Create new job
-            job = Job(**job_data)
-            session.add(job)
+            for job_data in job_dicts:
+                job = _upsert_job(session, job_data)
+                session.flush()  # So a repeated external_id later in the list finds this row
+                job_ids.append(job.id)
 
-        session.commit()
-        session.refresh(job)
-        return job.id
-    finally:
-        session.close()
+    forget_cached_jobs(job_ids)
+    invalidate_stats_cache()
+    return job_ids
+
+
+def _upsert_job(session, job_data: Dict[str, Any]) -> Job:
+    """Update the job with job_data's external_id, or add a new one, in the given session (not committed)."""
+    external_id = job_data.get("external_id")
+    job = None
+
+    if external_id:
+        job = session.query(Job).filter_by(external_id=external_id).first()
+
+    if job:
+        # Update existing job
+        for key, value in job_data.items():
+            if hasattr(job, key):
+                setattr(job, key, value)
+        job.updated_at = datetime.utcnow()
+    else:
+        # Create new job
+        job = Job(**job_data)
+        session.add(job)
+
+    return job
 
 
 def get_job(job_id: int) -> Optional[Dict[str, Any]]:
-    """Get job by ID."""
-    session = get_session()
-    try:
-        job = session.query(Job).filter_by(id=job_id).first()
-        if job:
-            return {
-                "id": job.id,
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "job_type": job.job_type,
-                "salary_range": job.salary_range,
-                "description": job.description,
-                "url": job.url,
-                "posted_date": job.posted_date,
-                "deadline": job.deadline,
-            }
-        return None
-    finally:
-        session.close()
+    """Get job by ID (cached for JOB_CACHE_TTL)."""
+    with _job_cache_lock:
+        entry = _job_cache.get(job_id)
+    if entry and time.monotonic() - entry[0] < JOB_CACHE_TTL:
+        return dict(entry[1])
+
+    job_data = _load_job(job_id)
+    if job_data is not None:
+        with _job_cache_lock:
+            _job_cache.pop(job_id, None)
+            if len(_job_cache) >= JOB_CACHE_MAX_SIZE:
+                del _job_cache[next(iter(_job_cache))]  # Entries are kept in insertion order, oldest first
+            _job_cache[job_id] = (time.monotonic(), job_data)
+        return dict(job_data)
+    return None
+
+
+def forget_cached_jobs(job_ids: Optional[List[int]] = None) -> None:
+    """Drop the given jobs (or all jobs) from get_job's cache; call after writing to them."""
+    with _job_cache_lock:
+        if job_ids is None:
+            _job_cache.clear()
+        else:
+            for job_id in job_ids:
+                _job_cache.pop(job_id, None)
+
+
+def _load_job(job_id: int) -> Optional[Dict[str, Any]]:
+    """Read a job's details from the database."""
+    # Only the returned columns; requirements and the other unreturned columns stay in the database
+    query = select(
+        Job.id,
+        Job.title,
+        Job.company,
+        Job.location,
+        Job.job_type,
+        Job.salary_range,
+        Job.description,
+        Job.url,
+        Job.posted_date,
+        Job.deadline,
+    ).where(Job.id == job_id)
+    with session_scope() as session:
+        row = session.execute(query).mappings().first()
+        return dict(row) if row else None
 
 
 def search_jobs(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Search jobs with filters."""
-    session = get_session()
-    try:
-        query = session.query(Job).filter_by(is_active=True)
+    # Select only the returned columns: plain rows skip building and tracking full Job objects
+    query = select(
+        Job.id, Job.title, Job.company, Job.location, Job.salary_range, Job.posted_date, Job.url
+    ).where(Job.is_active.is_(True))
+
+    if "keyword" in filters:
+        keyword = filters["keyword"]
+        if _job_search_fts and len(keyword) >= 3:
+            # Trigrams need at least three characters; the keyword is quoted as one FTS5 phrase
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            matches = text("SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH :phrase").bindparams(phrase=phrase)
+            query = query.where(Job.id.in_(matches.columns(column("rowid", Integer))))
+        else:
+            query = query.where((Job.title.like(f"%{keyword}%")) | (Job.description.like(f"%{keyword}%")))
 
-        if "keyword" in filters:
-            keyword = f"%{filters['keyword']}%"
-            query = query.filter((Job.title.like(keyword)) | (Job.description.like(keyword)))
+    if "location" in filters:
+        query = query.where(Job.location.like(f"%{filters['location']}%"))
 
-        if "location" in filters:
-            query = query.filter(Job.location.like(f"%{filters['location']}%"))
+    if "job_type" in filters:
+        query = query.where(Job.job_type == filters["job_type"])
 
-        if "job_type" in filters:
-            query = query.filter_by(job_type=filters["job_type"])
+    query = query.order_by(Job.posted_date.desc()).limit(100)
 
-        jobs = query.order_by(Job.posted_date.desc()).limit(100).all()
-
-        return [
-            {
-                "id": job.id,
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "salary_range": job.salary_range,
-                "posted_date": job.posted_date,
-                "url": job.url,
-            }
-            for job in jobs
-        ]
-    finally:
-        session.close()
+    with session_scope() as session:
+        return [dict(row) for row in session.execute(query).mappings()]
 
 
 # ============================================================================
@@ -395,8 +742,7 @@ def search_jobs(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 def create_application(profile_id: int, job_id: int, status: str = "interested", notes: str = "") -> int:
     """Create a job application record."""
-    session = get_session()
-    try:
+    with session_scope() as session:
         application = JobApplication(
             profile_id=profile_id,
             job_id=job_id,
@@ -404,50 +750,196 @@ def create_application(profile_id: int, job_id: int, status: str = "interested",
             notes=notes,
         )
         session.add(application)
-        session.commit()
-        session.refresh(application)
-        return application.id
-    finally:
-        session.close()
+
+    invalidate_stats_cache()
+    return application.id
+
+
+def create_applications_bulk(
+    profile_id: int, job_ids: List[int], status: str = "interested", notes: str = "", return_ids: bool = True
+) -> Optional[List[int]]:
+    """
+    Create an application for each job in one transaction.
+
+    Returns the application IDs in job_ids order, fetched in batches of APPLICATION_INSERT_BATCH_SIZE via
+    RETURNING. With return_ids=False it returns None and runs one plain executemany INSERT instead.
+    """
+    if not job_ids:
+        return [] if return_ids else None
+
+    rows = [{"profile_id": profile_id, "job_id": job_id, "status": status, "notes": notes} for job_id in job_ids]
+
+    application_ids = []
+    with session_scope() as session:
+        if return_ids:
+            stmt = insert(JobApplication).returning(JobApplication.id, sort_by_parameter_order=True)
+            for start in range(0, len(rows), APPLICATION_INSERT_BATCH_SIZE):
+                application_ids.extend(session.scalars(stmt, rows[start : start + APPLICATION_INSERT_BATCH_SIZE]).all())
+        else:
+            session.execute(insert(JobApplication), rows)
+
+    invalidate_stats_cache()
+    return application_ids if return_ids else None
+
+
+def save_and_apply(job_data: Dict[str, Any], profile_id: int, status: str = "applied", notes: str = "") -> int:
+    """Save or update a job and create an application for it in one transaction; returns the job ID."""
+    with session_scope() as session:
+        job = _upsert_job(session, job_data)
+        session.add(JobApplication(profile_id=profile_id, job=job, status=status, notes=notes))
+
+    forget_cached_jobs([job.id])
+    invalidate_stats_cache()
+    return job.id
 
 
 def update_application_status(application_id: int, status: str, notes: str = "") -> bool:
     """Update job application status."""
-    session = get_session()
-    try:
-        application = session.query(JobApplication).filter_by(id=application_id).first()
+    with session_scope() as session:
+        application = session.get(JobApplication, application_id)
         if application:
             application.status = status
             if notes:
                 application.notes = notes
             application.updated_at = datetime.utcnow()
-            session.commit()
-            return True
-        return False
-    finally:
-        session.close()
+        else:
+            return False
+
+    invalidate_stats_cache()
+    return True
 
 
 def get_applications_for_profile(profile_id: int) -> List[Dict[str, Any]]:
     """Get all applications for a profile."""
-    session = get_session()
-    try:
-        applications = (
+    query = (
+        select(
+            JobApplication.id,
+            JobApplication.job_id,
+            JobApplication.status,
+            JobApplication.applied_date,
+            JobApplication.notes,
+        )
+        .where(JobApplication.profile_id == profile_id)
+        .order_by(JobApplication.created_at.desc())
+    )
+    with session_scope() as session:
+        return [dict(row) for row in session.execute(query).mappings()]
+
+
+def get_applications_for_profile_with_jobs(profile_id: int) -> List[Dict[str, Any]]:
+    """
+    Get all applications for a profile together with their job's details.
+
+    One joined SELECT of just the listed columns, rather than a get_job() call per application.
+    """
+    query = (
+        select(
+            JobApplication.id,
+            JobApplication.job_id,
+            JobApplication.status,
+            JobApplication.applied_date,
+            JobApplication.notes,
+            Job.title,
+            Job.company,
+            Job.location,
+            Job.url,
+        )
+        .join(Job, JobApplication.job_id == Job.id)
+        .where(JobApplication.profile_id == profile_id)
+        .order_by(JobApplication.created_at.desc())
+    )
+    with session_scope() as session:
+        return [dict(row) for row in session.execute(query).mappings()]
+
+
+# ============================================================================
+# Statistics Functions
+# ============================================================================
+
+
+def invalidate_stats_cache() -> None:
+    """Forget cached statistics and recent activity; call after any write that changes them."""
+    global _stats_cache_generation
+    _stats_cache_generation += 1
+    _stats_cache.clear()
+
+
+def _get_cached_stats(key: Any) -> Any:
+    """Get a cached statistics value younger than STATS_CACHE_TTL, or None."""
+    entry = _stats_cache.get(key)
+    if entry and time.monotonic() - entry[0] < STATS_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _store_cached_stats(key: Any, generation: int, value: Any) -> None:
+    """Cache a statistics value, unless a write invalidated the cache while it was being queried."""
+    if generation == _stats_cache_generation:
+        _stats_cache[key] = (time.monotonic(), value)
+
+
+def get_cached_user_statistics() -> Optional[Dict[str, int]]:
+    """Get the cached result of get_user_statistics without touching the database, if still fresh."""
+    stats = _get_cached_stats("statistics")
+    return dict(stats) if stats is not None else None
+
+
+def get_user_statistics(session=None) -> Dict[str, int]:
+    """
+    Get saved job and application counts for the dashboard (cached for STATS_CACHE_TTL).
+
+    Runs on the given session if one is passed (the caller owns it), otherwise in its own session_scope().
+    """
+    cached = get_cached_user_statistics()
+    if cached is not None:
+        return cached
+
+    generation = _stats_cache_generation
+    with nullcontext(session) if session is not None else session_scope() as session:
+        # One statement: saved jobs as a scalar subquery, application counts via conditional aggregation
+        saved_jobs_count = select(func.count()).select_from(Job).where(Job.is_active.is_(True))
+        saved_jobs, applications, interviews, offers = session.execute(
+            select(
+                saved_jobs_count.scalar_subquery(),
+                func.count(JobApplication.id),
+                func.count(case((JobApplication.status == "interview", 1))),
+                func.count(case((JobApplication.status == "accepted", 1))),
+            )
+        ).one()
+
+        stats = {"saved_jobs": saved_jobs, "applications": applications, "interviews": interviews, "offers": offers}
+        _store_cached_stats("statistics", generation, stats)
+        return dict(stats)
+
+
+def get_recent_activity(limit: int = 5, session=None) -> List[Dict[str, Any]]:
+    """
+    Get the most recently created applications with their job (cached for STATS_CACHE_TTL).
+
+    Runs on the given session if one is passed (the caller owns it), otherwise in its own session_scope().
+    """
+    cached = _get_cached_stats(("recent_activity", limit))
+    if cached is not None:
+        return list(cached)
+
+    generation = _stats_cache_generation
+    with nullcontext(session) if session is not None else session_scope() as session:
+        recent = (
             session.query(JobApplication)
-            .filter_by(profile_id=profile_id)
+            .options(joinedload(JobApplication.job))
             .order_by(JobApplication.created_at.desc())
+            .limit(limit)
             .all()
         )
 
-        return [
+        activity = [
             {
-                "id": app.id,
-                "job_id": app.job_id,
                 "status": app.status,
-                "applied_date": app.applied_date,
-                "notes": app.notes,
+                "title": app.job.title,
+                "company": app.job.company,
+                "created_at": app.created_at,
             }
-            for app in applications
+            for app in recent
         ]
-    finally:
-        session.close()
+        _store_cached_stats(("recent_activity", limit), generation, activity)
+        return list(activity)
@@ -6,18 +6,22 @@ Uses production-ready utilities for HTTP requests, data models, and location han
 """
 
 import logging
-from typing import Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Literal, Optional
 from urllib.parse import quote_plus
 
+import httpx
 from pydantic import ValidationError
 
-from jobpulse.config import API_BASE_URL
-from jobpulse.http_client import api_get, close_http_client
+from jobpulse.config import API_BASE_URL, MAX_CONNECTIONS
+from jobpulse.http_client import api_get, close_http_client, get_http_client
 from jobpulse.locations import get_city_id
 from jobpulse.models import SearchResults
 
 logger = logging.getLogger(__name__)
 
+SEARCH_ENDPOINT = f"{API_BASE_URL}/Jobs/api/JobSearch/GetJobSearch"
+
 
 def build_search_url(
     keyword: str,
@@ -82,43 +86,31 @@ def build_search_url(
     location_id = get_city_id(location) if location else None
     location_param = location_id if location_id is not None else ""
 
-    # Build URL with all parameters
+    # One f-string: CPython merges the runs of fixed (always empty) parameters into constants at
+    # compile time, which measures several times faster than str.format or urlencode here
     search_url = (
-        f"{API_BASE_URL}/Jobs/api/JobSearch/GetJobSearch?"
-        f"Icat=&"
-        f"industry=&"
-        f"category=&"
-        f"org=&"
-        f"jobNature=&"
-        f"Fcat=&"
+        f"{SEARCH_ENDPOINT}?"
+        "Icat=&industry=&category=&org=&jobNature=&Fcat=&"
         f"location={location_param}&"
-        f"Qot=&"
-        f"jobType={quote_plus(job_type)}&"
-        f"jobLevel={quote_plus(job_level)}&"
+        "Qot=&"
+        f"jobType={quote_plus(job_type) if job_type else ''}&"
+        f"jobLevel={quote_plus(job_level) if job_level else ''}&"
         f"postedWithin={posted_within}&"
-        f"deadline=&"
+        "deadline=&"
         f"keyword={quote_plus(keyword)}&"
         f"pg={page}&"
         f"qAge={age_range}&"
         f"Salary={salary_range}&"
         f"experience={experience_range}&"
         f"gender={gender}&"
-        f"MExp=&"
-        f"genderB=&"
-        f"MPostings=&"
-        f"MCat=&"
-        f"version=&"
+        "MExp=&genderB=&MPostings=&MCat=&version=&"
         f"rpp={results_per_page}&"
-        f"Newspaper=&"
+        "Newspaper=&"
         f"armyp={armyp}&"
-        f"QDisablePerson=&"
-        f"pwd=&"
+        "QDisablePerson=&pwd=&"
         f"workplace={workplace}&"
         f"facilitiesForPWD={facilities_for_pwd}&"
-        f"SaveFilterList=&"
-        f"UserFilterName=&"
-        f"HUserFilterName=&"
-        f"earlyJobAccess=&"
+        "SaveFilterList=&UserFilterName=&HUserFilterName=&earlyJobAccess=&"
         f"isPro={is_pro}&"
         f"ToggleJobs={'true' if toggle_jobs else 'false'}&"
         f"isFresher={'true' if is_fresher else 'false'}"
@@ -148,6 +140,7 @@ def search_jobs(
     armyp: Literal["", "yes"] = "",
     workplace: Literal["", "1"] = "",
     facilities_for_pwd: Literal["", "1"] = "",
+    client: Optional[httpx.Client] = None,
 ) -> SearchResults:
     """
     Search for jobs based on keyword and filters using the BDJobs API.
@@ -173,6 +166,7 @@ def search_jobs(
         armyp: Retired army preferred ("yes" or "")
         workplace: Work from home (1 or "")
         facilities_for_pwd: Facilities for persons with disabilities (1 or "")
+        client: HTTP client to reuse (default: the shared pooled client)
 
     Returns:
         SearchResults object containing job listings and metadata
@@ -221,11 +215,11 @@ def search_jobs(
 
         logger.info(f"Searching jobs with keyword='{keyword}', location='{location}', page={page}")
 
-        response_data = api_get(search_url)
+        response_data = api_get(search_url, client=client)
 
         # Parse and validate response
         try:
-            results = SearchResults(**response_data)
+            results = SearchResults.model_validate(response_data)
 
             if not results.is_success():
                 logger.warning(f"API returned non-success status: {results.message}")
@@ -243,9 +237,37 @@ def search_jobs(
         raise
 
 
+def search_jobs_paged(keyword: str, pages: Iterable[int] = range(1, 11), **filters: Any) -> List[SearchResults]:
+    """
+    Fetch several result pages of one search concurrently.
+
+    Pages are requested from a thread pool over the shared pooled client, so their round trips
+    overlap while rate_limit() still spaces out the request starts.
+
+    Args:
+        keyword: Job search keyword (required)
+        pages: Page numbers to fetch (default: 1-10)
+        **filters: Any other search_jobs() arguments, applied to every page
+
+    Returns:
+        One SearchResults per page, in the order of pages
+
+    Raises:
+        The first error raised by any page's search_jobs() call
+    """
+    pages = list(pages)
+    if not pages:
+        return []
+
+    filters.setdefault("client", get_http_client())
+    with ThreadPoolExecutor(max_workers=min(len(pages), MAX_CONNECTIONS)) as executor:
+        return list(executor.map(lambda page: search_jobs(keyword, page=page, **filters), pages))
+
+
 # Re-export commonly used items
 __all__ = [
     "search_jobs",
+    "search_jobs_paged",
     "build_search_url",
     "close_http_client",
 ]
@@ -270,7 +292,7 @@ if __name__ == "__main__":
             print(f"   Company: {job.companyName}")
             print(f"   Location: {job.location}")
             print(f"   Deadline: {job.deadline}")
-            print(f"   URL: {job.get_job_url()}")
+            print(f"   URL: {job.job_url}")
             print()
 
     except Exception as e: